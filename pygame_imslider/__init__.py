@@ -3,6 +3,8 @@
 """Flexible images slider highly customizable for pygame."""
 
 from .slider import ImSlider, STYPE_SLIDE, STYPE_LOOP, STYPE_FADE
+from .group import SliderGroup
 from .renderers import ImSliderRenderer
+from .cache import SurfaceCache, DiskCache, AssetRegistry
 
 __version__ = '1.0.2'
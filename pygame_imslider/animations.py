@@ -1,8 +1,69 @@
 # -*- coding: utf-8 -*-
 
+import math
+from collections import OrderedDict
 import pygame
 
 
+class Scheduler(object):
+
+    """Run the animations of several sprites. Only the running animations are
+    stored (by sprite), the animations of a sprite are applied according to
+    the add order. When finished, an animation is discarded.
+    """
+
+    def __init__(self):
+        self.animations = OrderedDict()
+
+    def __len__(self):
+        return sum(len(animations) for animations in self.animations.values())
+
+    def add(self, sprite, animation):
+        """Add a new animation.
+
+        :param sprite: sprite to animate
+        :type sprite: :py:class:`pygame.DirtySprite`
+        :param animation: animation to apply on the sprite
+        :type animation: :py:class:`Animation`
+        """
+        self.animations.setdefault(sprite, []).append(animation)
+
+    def remove(self, sprite):
+        """Remove all animations of the given sprite.
+
+        :param sprite: animated sprite
+        :type sprite: :py:class:`pygame.DirtySprite`
+        """
+        self.animations.pop(sprite, None)
+
+    def is_running(self, sprite=None):
+        """Return True if there is at least one animation running.
+
+        :param sprite: only consider the animations of this sprite
+        :type sprite: :py:class:`pygame.DirtySprite`
+        """
+        if sprite is None:
+            return len(self.animations) > 0
+        return sprite in self.animations
+
+    def update(self, dt):
+        """Apply all running animations.
+
+        :param dt: elapsed time since last call
+        :type dt: int
+        """
+        finished = []
+        for sprite, animations in self.animations.items():
+            for animation in animations:
+                animation(sprite, dt)
+            if any(animation.finished for animation in animations):
+                animations[:] = [animation for animation in animations if not animation.finished]
+                if not animations:
+                    finished.append(sprite)
+        for sprite in finished:
+            del self.animations[sprite]
+
+
 class Animation(object):
 
     def __init__(self, clip, duration):
@@ -28,55 +89,44 @@ class Animation(object):
         raise NotImplementedError
 
 
-class Transpose(Animation):
+class Scroll(Animation):
 
-    """Transpose to the position.
+    """Scroll a slides strip to the offset. All slides of the strip move by
+    the same amount, only one position is interpolated.
 
-    :param x: X coordinate to move to
-    :type x: int
-    :param y: Y coordinate to move to
-    :type y: int
+    :param offset: offset to scroll to
+    :type offset: int
     :param duration: animation duration in second (0 = instantaneous)
     :type duration: int
     """
 
-    def __init__(self, clip, x, y, duration):
-        super(Transpose, self).__init__(clip, duration)
-        self.destination = pygame.math.Vector2(x, y)
+    def __init__(self, clip, offset, duration):
+        super(Scroll, self).__init__(clip, duration)
+        self.destination = offset
         self.velocity = None
-        self.ini_position = None
+        self.ini_offset = 0
 
-    def _apply(self, slide):
+    def _apply(self, layout):
         if self.duration <= 0:
-            slide.set_position(*self.destination)
+            layout.set_offset(self.destination)
             self.finished = True
             return
 
-        # Initialize velocity according to distance between current position and
-        # destination
-        if not self.velocity:
-            self.ini_position = slide.rect.topleft
-            self.velocity = (self.destination - slide.rect.topleft) / self.duration
+        if self.velocity is None:
+            self.ini_offset = layout.offset
+            self.velocity = (self.destination - self.ini_offset) / self.duration
 
-        new_pos = self.ini_position + self.velocity * self.time
+        # The slides are placed on integer positions
+        new_offset = math.floor(self.ini_offset + self.velocity * self.time)
 
         # Ensure that destination is not overrun
-        if (self.velocity.x > 0 and new_pos.x > self.destination.x)\
-                or (self.velocity.x < 0 and new_pos.x < self.destination.x):
-            new_pos.x = self.destination.x
-        if (self.velocity.y > 0 and new_pos.y > self.destination.y)\
-                or (self.velocity.y < 0 and new_pos.y < self.destination.y):
-            new_pos.y = self.destination.y
-
-        slide.set_position(*new_pos)
-        if self.clip.colliderect(slide.rect):
-            if not slide.visible:
-                slide.visible = 1
-        else:
-            if slide.visible:
-                slide.visible = 0
+        if (self.velocity > 0 and new_offset > self.destination)\
+                or (self.velocity < 0 and new_offset < self.destination):
+            new_offset = self.destination
+
+        layout.set_offset(new_offset)
 
-        if slide.rect.topleft == self.destination:
+        if new_offset == self.destination:
             self.finished = True
 
 
@@ -127,6 +177,25 @@ class Fade(Animation):
             self.finished = True
 
 
+class Blend(Animation):
+
+    """Blend progressively the selected slide of the layout over the
+    current one.
+
+    :param duration: animation duration in second (0 = instantaneous)
+    :type duration: int
+    """
+
+    def _apply(self, layout):
+        if self.time >= self.duration:
+            alpha = 255
+        else:
+            alpha = int(255 * self.time / self.duration)
+        layout.set_blend(alpha)
+        if alpha == 255:
+            self.finished = True
+
+
 class Exit(Animation):
 
     """Change image visibility to 0.
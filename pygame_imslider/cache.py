@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+import os
+import struct
+import hashlib
+import os.path as osp
+from collections import OrderedDict
+import pygame
+
+
+class SurfaceCache(object):
+
+    """Cache of decoded images limited by the memory used by the surfaces.
+    When the limit is reached, the least recently used surfaces are evicted.
+
+    A cache can be shared by several sliders.
+
+    :param max_size: maximum size of the cached surfaces in bytes
+    :type max_size: int
+    """
+
+    def __init__(self, max_size=64 * 1024 * 1024):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def __contains__(self, key):
+        return key in self._surfaces
+
+    @staticmethod
+    def get_key(path):
+        """Return the key of the given image file (the key changes if the file
+        is modified).
+
+        :param path: path to the image file
+        :type path: str
+        """
+        return (osp.abspath(path), osp.getmtime(path))
+
+    @staticmethod
+    def get_surface_size(surface):
+        """Return the memory used by the pixels of the surface in bytes.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def get(self, key):
+        """Return the surface for the given key (None if not in the cache).
+
+        :param key: key returned by :py:meth:`SurfaceCache.get_key`
+        :type key: tuple
+        """
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+        return surface
+
+    def put(self, key, surface):
+        """Add a surface in the cache and evict the least recently used ones if
+        the maximum size is exceeded (the last added surface is never evicted).
+
+        :param key: key returned by :py:meth:`SurfaceCache.get_key`
+        :type key: tuple
+        :param surface: surface to store
+        :type surface: :py:class:`pygame.Surface`
+        """
+        if key in self._surfaces:
+            self.size -= self.get_surface_size(self._surfaces.pop(key))
+        self._surfaces[key] = surface
+        self.size += self.get_surface_size(surface)
+        while self.size > self.max_size and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.size -= self.get_surface_size(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all surfaces from the cache.
+        """
+        self._surfaces.clear()
+        self.size = 0
+
+    def get_stats(self):
+        """Return a dictionary with the cache statistics.
+        """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'count': len(self._surfaces),
+                'size': self.size,
+                'max_size': self.max_size}
+
+
+class AssetRegistry(object):
+
+    """Registry of the icons (arrows, dots...) used by the sliders. An icon
+    file is decoded once, and the icons derived from it (scaled, colorized)
+    are shared by all the sliders and renderers using the registry. The least
+    recently used derived icons are discarded when more than ``max_count``
+    are stored.
+
+    :param max_count: maximum number of derived icons
+    :type max_count: int
+    """
+
+    def __init__(self, max_count=256):
+        self.max_count = max_count
+        self._sources = {}
+        self._surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def load(self, path):
+        """Return the surface of the given icon file, the file is decoded at
+        first call only.
+
+        The returned surface is shared, it shall not be modified.
+
+        :param path: path to the icon file
+        :type path: str
+        """
+        path = osp.abspath(path)
+        surface = self._sources.get(path)
+        if surface is None:
+            surface = pygame.image.load(path).convert_alpha()
+            self._sources[path] = surface
+        return surface
+
+    def get(self, key, build):
+        """Return the surface stored for the given key, build it if it is not
+        yet stored.
+
+        The returned surface is shared, it shall not be modified.
+
+        :param key: key of the surface (icon, size, color...)
+        :type key: tuple
+        :param build: function called without argument to build the surface
+        :type build: function
+        """
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = build()
+            self._surfaces[key] = surface
+            if len(self._surfaces) > self.max_count:
+                self._surfaces.popitem(last=False)
+        else:
+            self._surfaces.move_to_end(key)
+        return surface
+
+    def clear(self):
+        """Remove all surfaces from the registry (icon files will be decoded
+        again).
+        """
+        self._sources.clear()
+        self._surfaces.clear()
+
+
+ASSETS = AssetRegistry()
+
+
+class DiskCache(object):
+
+    """Persistent cache of the images scaled to the slides size. The pixels are
+    stored in a raw format which is read without decoding, avoiding image
+    decoding and scaling at next start.
+
+    If ``max_size`` is given, the least recently used files are removed when
+    the files exceed this size, else the directory grows with each image and
+    slide size and shall be pruned by the application.
+
+    A cache can be shared by several sliders. The errors when writing in the
+    directory (read-only, full disk) are ignored, the images are just not
+    stored.
+
+    :param directory: directory where scaled images are stored
+    :type directory: str
+    :param max_size: maximum size of the stored files in bytes (None for no limit)
+    :type max_size: int
+    """
+
+    # Width, height and bytes per pixel (3 for an opaque image)
+    HEADER = struct.Struct('<III')
+
+    def __init__(self, directory, max_size=None):
+        self.directory = directory
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        if not osp.isdir(self.directory):
+            os.makedirs(self.directory)
+        if self.max_size is not None:
+            self.prune()
+
+    @staticmethod
+    def get_key(path, size, padding):
+        """Return the key of the given image file scaled to the given slide size
+        (the key changes if the file is modified).
+
+        :param path: path to the image file
+        :type path: str
+        :param size: size of the slide
+        :type size: tuple
+        :param padding: padding between the slide border and the image
+        :type padding: int
+        """
+        return (osp.abspath(path), osp.getmtime(path), tuple(size), padding)
+
+    def get_path(self, key):
+        """Return the path of the file storing the surface for the given key.
+        """
+        name = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return osp.join(self.directory, name + '.rgba')
+
+    def get(self, key):
+        """Return the surface for the given key (None if not in the cache or
+        if the stored file is truncated or corrupted).
+
+        The returned surface is not converted to the display format.
+
+        :param key: key returned by :py:meth:`DiskCache.get_key`
+        :type key: tuple
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, 'rb') as fp:
+                width, height, depth = self.HEADER.unpack(fp.read(self.HEADER.size))
+                length = width * height * depth
+                # Reject a file truncated or garbled (unexpected power loss)
+                valid = depth in (3, 4) and length > 0\
+                    and os.fstat(fp.fileno()).st_size == self.HEADER.size + length
+                if valid:
+                    pixels = bytearray(length)
+                    valid = fp.readinto(pixels) == length
+            if valid and self.max_size is not None:
+                os.utime(path)  # Most recently used
+        except (OSError, struct.error):
+            valid = False
+        if not valid:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # The surface keeps a reference on the buffer
+        return pygame.image.frombuffer(pixels, (width, height), 'RGB' if depth == 3 else 'RGBA')
+
+    def put(self, key, surface):
+        """Store a surface in the cache. Return False if the surface can not
+        be written in the directory.
+
+        :param key: key returned by :py:meth:`DiskCache.get_key`
+        :type key: tuple
+        :param surface: surface to store
+        :type surface: :py:class:`pygame.Surface`
+        """
+        path = self.get_path(key)
+        tmp_path = path + '.tmp'
+        depth = 4 if surface.get_masks()[3] else 3
+        try:
+            with open(tmp_path, 'wb') as fp:
+                fp.write(self.HEADER.pack(surface.get_width(), surface.get_height(), depth))
+                fp.write(pygame.image.tostring(surface, 'RGBA' if depth == 4 else 'RGB'))
+            os.replace(tmp_path, path)  # Readers never see a partial file
+        except OSError:
+            self.errors += 1
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        if self.max_size is not None:
+            self.size += self.HEADER.size + surface.get_width() * surface.get_height() * depth
+            if self.size > self.max_size:
+                self.prune()
+        return True
+
+    def prune(self):
+        """Remove the least recently used files until the size of the files is
+        lower than ``max_size``.
+        """
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.rgba'):
+                path = osp.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # Removed by another process
+                files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        self.size = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if self.max_size is None or self.size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.size -= size
+
+    def get_stats(self):
+        """Return a dictionary with the cache statistics.
+        """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'errors': self.errors,
+                'size': self.size,
+                'max_size': self.max_size}
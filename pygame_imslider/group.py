@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+import pygame
+
+POINTER_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.FINGERDOWN, pygame.FINGERUP)
+
+
+def coalesce_rects(rects):
+    """Return a list of rectangles covering the given ones where the
+    overlapping rectangles are merged (empty rectangles are ignored).
+
+    :param rects: list of rectangles
+    :type rects: list
+    """
+    result = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        if not rect:
+            continue
+        index = rect.collidelist(result)
+        while index != -1:
+            rect.union_ip(result.pop(index))
+            index = rect.collidelist(result)
+        result.append(rect)
+    return result
+
+
+class SliderGroup(object):
+
+    """Container of several image sliders displayed on the same surface.
+
+    The sliders are updated with a single clock, each event is given only to
+    the slider concerned: the slider under the pointer for the mouse and touch
+    events, the slider having the focus for the other events. The last
+    clicked slider gets the focus, a key released after a focus change is
+    still given to the slider which has received the key press.
+
+    :param sliders: sliders to add in the group
+    :type sliders: list
+    """
+
+    def __init__(self, *sliders):
+        self.sliders = []
+        self.focus = None
+        self.clock = pygame.time.Clock()
+        # Sliders which have received a button/finger down event, they
+        # shall receive the button/finger up event
+        self._pressed = []
+        # Slider which has received the down event of each pressed key, it
+        # shall receive the up event even if the focus has changed
+        self._keys = {}
+        for slider in sliders:
+            self.add(slider)
+
+    def __len__(self):
+        return len(self.sliders)
+
+    def __iter__(self):
+        return iter(self.sliders)
+
+    def add(self, slider):
+        """Add a slider in the group, the first added one gets the focus.
+
+        :param slider: slider to add
+        :type slider: :py:class:`ImSlider`
+        """
+        if slider not in self.sliders:
+            self.sliders.append(slider)
+            if self.focus is None:
+                self.focus = slider
+
+    def remove(self, slider):
+        """Remove a slider from the group.
+
+        :param slider: slider to remove
+        :type slider: :py:class:`ImSlider`
+        """
+        self.sliders.remove(slider)
+        if slider in self._pressed:
+            self._pressed.remove(slider)
+        self._keys = {key: pressed for key, pressed in self._keys.items() if pressed is not slider}
+        if self.focus is slider:
+            self.focus = self.sliders[0] if self.sliders else None
+
+    def set_focus(self, slider):
+        """Set the slider receiving the keyboard and joystick events.
+
+        :param slider: slider of the group (None to give no focus)
+        :type slider: :py:class:`ImSlider`
+        """
+        assert slider is None or slider in self.sliders, "Slider not in the group"
+        self.focus = slider
+
+    def get_slider_at(self, position):
+        """Return the slider at the given position, None if there is no slider.
+
+        :param position: position to check slider at
+        :type position: tuple
+        """
+        for slider in reversed(self.sliders):  # Last drawn is on top
+            if slider.get_rect().collidepoint(position):
+                return slider
+        return None
+
+    def dispatch_events(self, events):
+        """Return the events to process by each slider.
+
+        :param events: list of events to process.
+        :type events: list
+        :return: dictionary of list of events by slider
+        :rtype: dict
+        """
+        routed = {slider: [] for slider in self.sliders}
+        display_size = None
+        for event in events:
+            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP) and event.button not in (1, 2, 3):
+                continue  # Mouse wheel (button 4 & 5) is not processed by the sliders
+            if event.type in POINTER_EVENTS:
+                if event.type in (pygame.FINGERDOWN, pygame.FINGERUP):
+                    if display_size is None:
+                        display_size = pygame.display.get_surface().get_size()
+                    pos = (event.x * display_size[0], event.y * display_size[1])
+                else:
+                    pos = event.pos
+                slider = self.get_slider_at(pos)
+                if event.type in (pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN):
+                    if slider:
+                        self.focus = slider
+                        if slider not in self._pressed:
+                            self._pressed.append(slider)
+                        routed[slider].append(event)
+                else:
+                    # Release the arrows and the dots pressed in any slider
+                    for pressed in self._pressed:
+                        routed[pressed].append(event)
+                    if slider and slider not in self._pressed:
+                        routed[slider].append(event)
+                    self._pressed = []
+            elif event.type == pygame.KEYUP:
+                slider = self._keys.pop(event.key, self.focus)
+                if slider is not None:
+                    routed[slider].append(event)
+            elif self.focus is not None:
+                if event.type == pygame.KEYDOWN:
+                    self._keys[event.key] = self.focus
+                routed[self.focus].append(event)
+        return routed
+
+    def update(self, events):
+        """Pygame events processing method. The idle sliders return
+        immediately (see :py:meth:`ImSlider.needs_update`).
+
+        :param events: list of events to process.
+        :type events: list
+        """
+        dt = self.clock.tick() / 1000  # Amount of seconds between each loop.
+        for slider, slider_events in self.dispatch_events(events).items():
+            slider.update(slider_events, dt)
+
+    def needs_update(self, events=()):
+        """Return True if one of the sliders has something to update (an
+        event processed by a slider is enough, whatever its position).
+
+        :param events: list of events to process.
+        :type events: list
+        """
+        return any(slider.needs_update(events) for slider in self.sliders)
+
+    def needs_redraw(self):
+        """Return True if one of the sliders has something to draw.
+        """
+        return any(slider.needs_redraw() for slider in self.sliders)
+
+    def draw(self, surface=None, force=False):
+        """Draw the image sliders.
+
+        :param surface: surface the sliders will be displayed at
+        :type surface: object
+        :param force: force the drawing of the entire sliders (time consuming)
+        :type force: bool
+
+        :return: list of updated area, overlapping areas are merged
+        :rtype: list
+        """
+        rects = []
+        for slider in self.sliders:
+            rects.extend(slider.draw(surface, force))
+        return coalesce_rects(rects)
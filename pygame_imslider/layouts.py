@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
-import itertools
+import math
 import pygame
 import pygame_imslider.animations as anim
+from .renderers import has_alpha_channel
 
 
 class SlidesLayout(pygame.sprite.LayeredDirty):
@@ -15,6 +16,32 @@ class SlidesLayout(pygame.sprite.LayeredDirty):
         self.focus = focus
         self.padding = padding
         self.selection = 0
+        # Position of the first slide of the strip relatively to the layout,
+        # the position of the other slides is derived from it
+        self.offset = 0
+        self.slide_size = (10, 10)
+        self.scheduler = anim.Scheduler()
+        # Number of slides kept loaded around the visible ones (None if
+        # the slides are not lazy loaded)
+        self.preload = None
+        self._loaded = set()
+        # Number of slides kept in the sprites group around the visible ones
+        # (None to keep all slides in the group)
+        self.margin = 2
+        # Compose the slides in one surface during the moves (one blit per frame)
+        self.compose = False
+        self._strip = None
+        self._strip_first = 0
+        # Time without resize after which the slides are rendered with a
+        # good quality (None if the size is settled)
+        self.resize_delay = 0.2
+        self._resize_time = None
+        # Executor used to scale the images of the slides in parallel (None
+        # to scale them in the main thread)
+        self.executor = None
+        # Render the slides with a fast scaling during the animations, the
+        # visible ones are rendered again when the animations are finished
+        self.fast_motion = False
         self.set_clip(pygame.Rect((0, 0), (10, 10)))
 
     @property
@@ -24,13 +51,21 @@ class SlidesLayout(pygame.sprite.LayeredDirty):
         return len(self.slides) - 1
 
     def add_slide(self, slide):
+        slide.set_index(len(self.slides))
         self.slides.append(slide)
-        slide.set_index(self.slides.index(slide))
-        self.add(slide)
+        if self.margin is None:
+            self.add(slide)
+
+    def remove_internal(self, sprite):
+        super(SlidesLayout, self).remove_internal(sprite)
+        self.scheduler.remove(sprite)
 
     def empty(self):
+        for slide in self.slides:
+            slide.unload()  # Cancel pending background decoding
         super(SlidesLayout, self).empty()
         self.slides = []
+        self._loaded = set()
 
     def update_slide_sizes(self):
         """Update slides size and position.
@@ -38,11 +73,138 @@ class SlidesLayout(pygame.sprite.LayeredDirty):
         width, height = self.rect.size
         slide_width = (width - ((1 + self.per_page) * self.padding)) // self.per_page
         slide_height = height - 2 * self.padding
-        pos = self.padding - self.selection * (slide_width + self.padding)
+        self.slide_size = (slide_width, slide_height)
         for slide in self.slides:
-            slide.set_position(self.rect.x + pos, self.rect.y + self.padding)
             slide.set_size(slide_width, slide_height)
-            pos += slide_width + self.padding
+        self.set_offset(self.padding - self.selection * self.get_step())
+
+    def get_step(self):
+        """Return the distance between the left side of two consecutive
+        slides of the strip.
+        """
+        return self.slide_size[0] + self.padding
+
+    def set_offset(self, offset):
+        """Scroll the slides strip. The slides of the sprites group are
+        placed in one pass.
+
+        :param offset: position of the first slide relatively to the layout
+        :type offset: float
+        """
+        self.offset = offset
+        if self._strip is None:
+            self.place_slides()
+
+    def place_slides(self):
+        """Set position and visibility of the slides of the sprites group.
+        """
+        for slide in self.sprites():
+            self.place_slide(slide)
+
+    def update_group(self):
+        """Keep in the sprites group only the slides close to the visible ones,
+        the per-frame cost does not depend on the number of slides. Nothing
+        is done if ``margin`` is None.
+        """
+        if self.margin is None:
+            return
+        indexes = self.get_window_indexes(self.margin, True)
+        for slide in self.sprites():
+            if slide.index not in indexes:
+                self.remove(slide)
+                if slide.visible:
+                    slide.visible = 0
+        for index in indexes:
+            slide = self.slides[index]
+            if not self.has(slide):
+                self.place_slide(slide)
+                # Keep drawing order of the slides whatever the order they
+                # are added
+                self.add(slide, layer=index)
+
+    def place_slide(self, slide, position=None):
+        """Set position and visibility of a slide according to its position
+        in the strip and the current strip offset.
+
+        :param slide: slide to place
+        :type slide: :py:class:`Slide`
+        :param position: position in the strip (slide index if None)
+        :type position: int
+        """
+        if position is None:
+            position = slide.index
+        slide.set_position(math.floor(self.rect.x + self.offset + position * self.get_step()),
+                           self.rect.y + self.padding)
+        if self.get_clip().colliderect(slide.rect):
+            if not slide.visible:
+                slide.visible = 1
+        elif slide.visible:
+            slide.visible = 0
+
+    def update_loaded_slides(self):
+        """Load the slides close to the visible ones and release the others.
+        Nothing is done if the slides are not lazy loaded.
+        """
+        if self.preload is None:
+            return
+        indexes = self.get_window_indexes(self.preload)
+        # Slides out of the previous window may have been loaded because
+        # they have been visible (they are in the sprites group)
+        for index in self._loaded.union(slide.index for slide in self.sprites()):
+            if index not in indexes:
+                self.slides[index].unload()
+        for index in indexes:
+            self.slides[index].load()
+        self._loaded = indexes
+
+    def get_window_indexes(self, margin, between=False):
+        """Return the indexes of the visible slides, of the slides of the
+        selected page and of the ``margin`` slides around them.
+
+        :param margin: number of slides around the visible ones
+        :type margin: int
+        :param between: include the slides between the visible ones and the
+                        selected page (they are visible during the transition)
+        :type between: bool
+        """
+        if not self.slides:
+            return set()
+        ranges = [(self.selection - self.per_page + 1, self.selection + self.per_page - 1)]
+        visibles = self.get_visible_range()
+        if visibles:
+            ranges.append(visibles)
+        if between:
+            ranges = [(min(first for first, _ in ranges), max(last for _, last in ranges))]
+        indexes = set()
+        for first, last in ranges:
+            for index in range(first - margin, last + margin + 1):
+                index = self.get_slide_index(index)
+                if index is not None:
+                    indexes.add(index)
+        return indexes
+
+    def get_slide_index(self, index):
+        """Return the index of the slide at the given position in the
+        slides strip (None if there is no slide at this position).
+
+        :param index: position in the slides strip
+        :type index: int
+        """
+        if 0 <= index < len(self.slides):
+            return index
+        return None
+
+    def get_strip_slide(self, index):
+        """Return the sprite displayed at the given position in the slides
+        strip (None if there is no slide at this position).
+
+        :param index: position in the slides strip
+        :type index: int
+        """
+        index = self.get_slide_index(index)
+        if index is None:
+            return None
+        return self.slides[index]
 
     def set_position(self, x, y):
         """Set the background position.
@@ -56,17 +218,27 @@ class SlidesLayout(pygame.sprite.LayeredDirty):
             self.rect.topleft = (int(x), int(y))
             self.get_clip().topleft = (int(x) + self.padding, int(y) + self.padding)
 
-    def set_size(self, width, height):
+    def set_size(self, width, height, draft=False):
         """Set the background size.
 
         :param width: background width
         :type width: int
         :param height: background height
         :type height: int
+        :param draft: render the visible slides with a fast scaling until the
+                      size has not changed for ``resize_delay`` seconds
+        :type draft: bool
         """
+        if not draft:
+            self._resize_time = None
+        elif self.slides and (width, height) != self.rect.size:
+            self._resize_time = 0
         self.rect.size = (width, height)
         self.get_clip().size = (width - 2 * self.padding, height - 2 * self.padding)
+        self._strip = None  # Composed for the previous size
         self.update_slide_sizes()
+        self.update_loaded_slides()
+        self.update_group()
 
     def set_selection(self, pos=None, step=None):
         """Change selected slide to next one.
@@ -91,19 +263,206 @@ class SlidesLayout(pygame.sprite.LayeredDirty):
             if self.focus:
                 self.slides[self.selection].set_selected(1)
 
+            self.update_loaded_slides()
+            self.update_group()
+
     def is_animated(self):
         """Return True if only one slide is currently annimated.
         """
-        for slide in self.slides:
-            if slide.is_animated():
-                return True
-        return False
+        return self.scheduler.is_running()
+
+    def is_resizing(self):
+        """Return True if the layout has been resized less than
+        ``resize_delay`` seconds ago.
+        """
+        return self._resize_time is not None
+
+    def is_drafting(self):
+        """Return True if the slides are rendered with a fast scaling: during
+        a resize, or during an animation if ``fast_motion`` is enabled.
+        """
+        return self.is_resizing() or (self.fast_motion and self.is_animated())
+
+    def render_slides(self):
+        """Render the slides of the sprites group. The visible slides are
+        rendered first (with a fast scaling while drafting, see
+        :py:meth:`SlidesLayout.is_drafting`), then the other ones, one per
+        call, when the layout is not drafting. Only the visible drafts are
+        rendered again.
+
+        If an executor is defined, the images of all the slides to render are
+        scaled in parallel. A visible slide is displayed as a draft until its
+        image is scaled, each slide is rendered with its scaled image at the
+        first call after its scaling is finished.
+        """
+        draft = self.is_drafting()
+        if self.executor is not None and not draft:
+            self.prescale_slides()
+        pending = None
+        for slide in self.sprites():
+            if slide.is_prescaling():
+                if slide.visible and slide.image is None:
+                    slide.render(True, True)
+            elif slide.visible:
+                slide.render(True, draft)
+            elif slide.is_prescaled():
+                slide.render()
+            elif pending is None and not slide.parent and slide.needs_render():
+                pending = slide
+        if pending and not draft:
+            pending.render()
+
+    def prescale_slides(self):
+        """Start the scaling of the images of the slides to render, the
+        visible slides first.
+        """
+        for slide in sorted(self.sprites(), key=lambda slide: not slide.visible):
+            if not slide.parent and slide.needs_render():
+                slide.prescale(self.executor)
+
+    def update(self, events, dt):
+        """Apply the running animations and update the slides.
+
+        :param events: list of events to process.
+        :type events: list
+        :param dt: elapsed time since last call
+        :type dt: int
+        """
+        running = self.scheduler.is_running()
+        self.scheduler.update(dt)
+        if self._resize_time is not None:
+            self._resize_time += dt
+            if self._resize_time >= self.resize_delay:
+                self._resize_time = None
+        if self._strip is not None and not self.scheduler.is_running():
+            # End of the move, the slides are drawn again
+            self._strip = None
+            self.place_slides()
+            self.repaint_rect(self.get_clip())
+        if running and not self.scheduler.is_running():
+            # End of the move, release the slides passed through
+            self.update_loaded_slides()
+            self.update_group()
+        self.render_slides()
+        super(SlidesLayout, self).update(events, dt)
+
+    def draw(self, surface, *args, **kwargs):
+        """Draw the slides. During a move of a composed strip, only the
+        visible part of the strip is blitted.
+
+        :param surface: surface the slides will be displayed at
+        :type surface: object
+        """
+        if self._strip is None:
+            return super(SlidesLayout, self).draw(surface, *args, **kwargs)
+        clip = self.get_clip()
+        if self._bgd and has_alpha_channel(self._strip):
+            surface.blit(self._bgd, clip, clip)
+        surface.blit(self._strip, clip, self.get_strip_area())
+        return [clip.copy()]
+
+    def get_strip_area(self):
+        """Return the area of the composed strip which is visible.
+        """
+        clip = self.get_clip()
+        x = math.floor(self.rect.x + self.offset + self._strip_first * self.get_step())
+        return pygame.Rect(clip.x - x, 0, clip.width, clip.height)
+
+    def scroll_to(self, offset, duration):
+        """Scroll the strip to the given offset.
+
+        :param offset: strip offset to scroll to
+        :type offset: float
+        :param duration: animation duration in second (0 = instantaneous)
+        :type duration: int
+        """
+        self.scheduler.add(self, anim.Scroll(self.get_clip(), offset, duration))
+        if self.compose and duration > 0 and self.slides:
+            self.compose_strip(offset)
+
+    def compose_strip(self, destination):
+        """Draw in one surface the slides visible during the move to the
+        given offset. Nothing is done if the strip is more than 4 times
+        larger than the visible area (the slides are drawn one by one).
+
+        :param destination: strip offset at the end of the move
+        :type destination: float
+        """
+        first, last = self.get_strip_range()
+        dest_first, dest_last = self.get_strip_range(destination)
+        first, last = min(first, dest_first), max(last, dest_last)
+        step = self.get_step()
+        width = (last - first) * step + self.slide_size[0]
+        if width > 4 * self.get_clip().width:
+            return
+        renderer = self.slides[0].renderer
+        self._strip = renderer.create_surface((width, self.slide_size[1]))
+        if has_alpha_channel(self._strip):
+            # Slides do not overlap, pixels are copied without blending
+            flags = pygame.BLEND_RGBA_MAX
+        else:
+            renderer.draw_background(self._strip)
+            flags = 0
+        self._strip_first = first
+        for position in range(first, last + 1):
+            index = self.get_slide_index(position)
+            if index is None:
+                continue
+            slide = self.slides[index]
+            slide.render(True, self.fast_motion)
+            self._strip.blit(slide.image, ((position - first) * step, 0), special_flags=flags)
+
+    def get_visible_range(self):
+        """Return the indexes of the first and the last visible slides, None
+        if no slide is visible. The range is computed from the strip offset.
+        """
+        if not self.slides:
+            return None
+        first, last = self.get_strip_range()
+        first = max(0, first)
+        last = min(self.last_idx, last)
+        if first > last:
+            return None
+        return (first, last)
+
+    def get_strip_range(self, offset=None):
+        """Return the first and the last positions of the strip which are
+        in the visible area for the given offset (whether there is a slide
+        at these positions or not).
+
+        :param offset: strip offset (current one if None)
+        :type offset: float
+        """
+        if offset is None:
+            offset = self.offset
+        clip = self.get_clip()
+        step = self.get_step()
+        origin = math.floor(self.rect.x + offset)  # Position of the first slide
+        return ((clip.left - origin - self.slide_size[0]) // step + 1, (clip.right - 1 - origin) // step)
 
     def get_visible_slides(self):
         """Return the list of visible slides.
         """
-        return [slide for slide in self.slides
-                if self.get_clip().colliderect(slide.rect) and slide.visible]
+        visibles = self.get_visible_range()
+        if not visibles:
+            return []
+        return self.slides[visibles[0]:visibles[1] + 1]
+
+    def get_slide_at(self, position):
+        """Return the visible slide at the given position, None if there is
+        no slide. The slide is computed from the slides geometry.
+
+        :param position: position to check slide at.
+        :type position: tuple
+        """
+        if not self.slides or not self.get_clip().collidepoint(position):
+            return None
+        step = self.get_step()
+        x = position[0] - math.floor(self.rect.x + self.offset)
+        top = self.rect.y + self.padding
+        if x % step < self.slide_size[0] and top <= position[1] < top + self.slide_size[1]:
+            return self.get_strip_slide(x // step)
+        return None
 
     def go_to_selection_forward(self, duration, center=False):
         """Move forward all slides to ensure that selection is visible.
@@ -119,18 +478,16 @@ class SlidesLayout(pygame.sprite.LayeredDirty):
         else:
             current = visibles[0]
 
-        step = self.slides.index(current) - self.selection
+        step = current.index - self.selection
         if step < 0:
             # Ensure to not go after last index
-            step = max(step, self.slides.index(visibles[-1]) - self.last_idx)
+            step = max(step, visibles[-1].index - self.last_idx)
 
         if step > 0:
             # Fast backward to begining
             step = min(step, len(self.slides) - len(visibles))
 
-        for slide in self.slides:
-            pos = slide.rect.x + step * (slide.rect.width + self.padding)
-            slide.add_animation(anim.Transpose(self.get_clip(), pos, slide.rect.y, duration))
+        self.scroll_to(self.offset + step * self.get_step(), duration)
 
     def go_to_selection_backward(self, duration, center=False):
         """Move backward all slides to ensure that selection is visible.
@@ -146,131 +503,200 @@ class SlidesLayout(pygame.sprite.LayeredDirty):
         else:
             current = visibles[0]
 
-        step = self.slides.index(current) - self.selection
+        step = current.index - self.selection
         if step > 0:
             # Ensure to not go after first index
-            step = min(step, self.slides.index(visibles[0]))
+            step = min(step, visibles[0].index)
 
         if step < 0:
             # Fast forward to the end
-            step = max(step, self.slides.index(visibles[-1]) - self.last_idx)
+            step = max(step, visibles[-1].index - self.last_idx)
 
-        for slide in self.slides:
-            pos = slide.rect.x + step * (slide.rect.width + self.padding)
-            slide.add_animation(anim.Transpose(self.get_clip(), pos, slide.rect.y, duration))
+        self.scroll_to(self.offset + step * self.get_step(), duration)
 
 
 class SlidesLayoutLoop(SlidesLayout):
 
+    def __init__(self, per_page, focus, padding=24):
+        super(SlidesLayoutLoop, self).__init__(per_page, focus, padding)
+        # Sprites of the sprites group by position in the strip (the strip
+        # loops around the slides list, the slide at a position is given by
+        # the position modulo the number of slides)
+        self._slots = {}
+        # Clones displayed when a slide is at several positions of the strip,
+        # they are kept to be reused at next moves
+        self._clones = {}
+        # Strip offset at the end of the current move
+        self._destination = 0
+
+    def empty(self):
+        super(SlidesLayoutLoop, self).empty()
+        self._slots = {}
+        self._clones = {}
+
+    def update_slide_sizes(self):
+        super(SlidesLayoutLoop, self).update_slide_sizes()
+        self._destination = self.offset
+
+    def update_group(self):
+        """Keep in the sprites group the slides at the positions of the strip
+        between the visible ones and the ones visible at the end of the current
+        move. A clone sharing the image of the slide is used when a slide is
+        at several positions.
+        """
+        if not self.slides:
+            return
+        first, last = self.get_strip_range()
+        dest_first, dest_last = self.get_strip_range(self._destination)
+        slots = {}
+        counts = {}
+        for position in range(min(first, dest_first) - self.margin, max(last, dest_last) + self.margin + 1):
+            slide = self.slides[position % len(self.slides)]
+            count = counts.get(slide.index, 0)
+            counts[slide.index] = count + 1
+            if count:
+                slide = self.get_clone(slide, count - 1)
+            slots[position] = slide
+
+        sprites = set(slots.values())
+        for sprite in self._slots.values():
+            if sprite not in sprites:
+                self.remove(sprite)
+                if sprite.parent:
+                    sprite.image = None  # Release the shared surface
+                if sprite.visible:
+                    sprite.visible = 0
+        self._slots = slots
+        for position, sprite in slots.items():
+            if not self.has(sprite):
+                self.add(sprite)
+            self.place_slide(sprite, position)
+
+    def get_clone(self, slide, number):
+        """Return a clone of the slide, the clones are created once.
+
+        :param slide: slide to clone
+        :type slide: :py:class:`Slide`
+        :param number: number of the clone
+        :type number: int
+        """
+        clones = self._clones.setdefault(slide.index, [])
+        while len(clones) <= number:
+            clones.append(slide.clone())
+        clones[number].set_size(*self.slide_size)
+        return clones[number]
+
+    def place_slides(self):
+        for position, sprite in self._slots.items():
+            self.place_slide(sprite, position)
+
+    def get_slide_index(self, index):
+        """Return the index of the slide at the given position in the
+        slides strip (the strip loops around the slides list).
+
+        :param index: position in the slides strip
+        :type index: int
+        """
+        return index % len(self.slides)
+
+    def get_strip_slide(self, index):
+        return self._slots.get(index, self.slides[index % len(self.slides)])
+
+    def get_visible_range(self):
+        if not self.slides:
+            return None
+        # Positions in the strip, index of the last slide may be lower than
+        # the first one
+        return self.get_strip_range()
+
     def get_visible_slides(self):
         """Return the list of visible slides and possible clones.
         """
-        return [slide for slide in self.get_x_ordered_slides()
-                if self.get_clip().colliderect(slide.rect) and slide.visible]
-
-    def get_x_ordered_slides(self, reverse=False):
-        """Return the list of slides and possible clones ordered by their X position.
+        visibles = self.get_visible_range()
+        if not visibles:
+            return []
+        return [self.get_strip_slide(position) for position in range(visibles[0], visibles[1] + 1)]
+
+    def go_to_selection(self, duration, center, forward):
+        """Scroll the strip to the nearest position of the selected slide in
+        the given direction.
         """
-        return sorted(self.sprites(), key=lambda sprite: sprite.rect.x, reverse=reverse)
-
-    def go_to_selection_forward(self, duration, center=False):
-        # Remove clones and replace it with hidden parent
-        for sprite in self.sprites():
-            if sprite.parent:
-                self.remove(sprite)
-                sprite.parent.set_position(*sprite.rect.topleft)
+        step = self.get_step()
+        first, last = self.get_strip_range()
+        if not self.scheduler.is_running():
+            # Keep the strip positions close to the slides indexes
+            self.offset += (first // len(self.slides)) * len(self.slides) * step
+            self._destination = self.offset
+            first, last = self.get_strip_range()
 
-        visibles = self.get_visible_slides()
         if center:
-            current = visibles[len(visibles) // 2]
+            current = first + (last - first + 1) // 2
         else:
-            current = visibles[0]
+            current = first
 
-        # Move all left hidden slides to the end
-        sprites = self.get_x_ordered_slides()
-        last_pos_x = sprites[-1].rect.right + self.padding
-        for slide in sprites[:sprites.index(visibles[0])]:
-            slide.set_position(last_pos_x, slide.rect.y)
-            last_pos_x = slide.rect.right + self.padding
-
-        sprites = self.get_x_ordered_slides()
-        current_idx = sprites.index(current)
-        selected_idx = sprites.index(self.slides[self.selection])
-        if current_idx <= selected_idx:
-            step = current_idx - selected_idx
+        if forward:
+            distance = -((self.selection - current) % len(self.slides))
         else:
-            step = current_idx - len(sprites) + selected_idx
-
-        # Clone slides to complete the sprites list
-        # Clones are not added to slides list, use self.add() method instead of self.add_slide()
-        right_hidden = len(sprites[sprites.index(visibles[-1]) + 1:])
-        missing = self.per_page - len(visibles) + abs(step) - right_hidden
-        count = 0
-        last_pos_x = sprites[-1].rect.right + self.padding
-        for slide in itertools.cycle(self.get_x_ordered_slides()):
-            if count >= missing:
-                break
-            clone = slide.clone()
-            clone.set_position(last_pos_x, slide.rect.y)
-            self.add(clone)
-            count += 1
-            last_pos_x = clone.rect.right + self.padding
-
-        # Add slide animations
-        for slide in self.get_x_ordered_slides():
-            pos = slide.rect.x + step * (slide.rect.width + self.padding)
-            slide.add_animation(anim.Transpose(self.get_clip(), pos, slide.rect.y, duration))
+            distance = (current - self.selection) % len(self.slides)
+
+        self._destination = self.offset + distance * step
+        self.update_group()
+        self.scroll_to(self._destination, duration)
+
+    def go_to_selection_forward(self, duration, center=False):
+        self.go_to_selection(duration, center, True)
 
     def go_to_selection_backward(self, duration, center=False):
-        # Remove clones and replace it with hidden parent
-        for sprite in self.sprites():
-            if sprite.parent:
-                self.remove(sprite)
-                sprite.parent.set_position(*sprite.rect.topleft)
+        self.go_to_selection(duration, center, False)
 
+
+class SlidesLayoutFade(SlidesLayout):
+
+    def __init__(self, per_page, focus, padding=24):
+        super(SlidesLayoutFade, self).__init__(per_page, focus, padding)
+        # Composites of the last drawn slides (by slide index)
+        self._composites = {}
+        # Slides of the running cross fade and alpha of the selected one
+        self._blended = None
+        self._blend_alpha = 0
+
+    def empty(self):
+        super(SlidesLayoutFade, self).empty()
+        self._composites = {}
+
+    def clear(self, surface, bgd):
+        super(SlidesLayoutFade, self).clear(surface, bgd)
+        self._composites = {}  # Drawn over the previous background
+
+    def get_window_indexes(self, margin, between=False):
+        # There is no slide passing through the view during a fade transition
+        indexes = set()
+        if not self.slides:
+            return indexes
+        for slide in self.get_visible_slides() + [self.slides[self.selection]]:
+            for index in range(slide.index - margin, slide.index + margin + 1):
+                if 0 <= index < len(self.slides):
+                    indexes.add(index)
+        return indexes
+
+    def get_visible_range(self):
         visibles = self.get_visible_slides()
-        if center:
-            current = visibles[len(visibles) // 2]
-        else:
-            current = visibles[0]
+        if not visibles:
+            return None
+        return (visibles[0].index, visibles[-1].index)
 
-        # Move all right hidden slides to the begining
-        sprites = self.get_x_ordered_slides()
-        first_pos_x = sprites[0].rect.left - self.padding
-        for slide in reversed(sprites[sprites.index(visibles[-1]) + 1:]):
-            slide.set_position(first_pos_x - slide.rect.width, slide.rect.y)
-            first_pos_x = slide.rect.left - self.padding
-
-        sprites = self.get_x_ordered_slides()
-        current_idx = sprites.index(current)
-        selected_idx = sprites.index(self.slides[self.selection])
-        if current_idx < selected_idx:
-            step = current_idx + len(sprites) - selected_idx
-        else:
-            step = current_idx - selected_idx
-
-        # Clone slides to complete the sprites list
-        # Clones are not added to slides list, use self.add() method instead of self.add_slide()
-        left_hidden = len(sprites[:sprites.index(visibles[0])])
-        missing = abs(step) - left_hidden
-        count = 0
-        first_pos_x = sprites[0].rect.left - self.padding
-        for slide in itertools.cycle(self.get_x_ordered_slides(reverse=True)):
-            if count >= missing:
-                break
-            clone = slide.clone()
-            clone.set_position(first_pos_x - slide.rect.width, slide.rect.y)
-            self.add(clone)
-            count += 1
-            first_pos_x = clone.rect.left - self.padding
-
-        # Add slide animations
-        for slide in self.get_x_ordered_slides():
-            pos = slide.rect.x + step * (slide.rect.width + self.padding)
-            slide.add_animation(anim.Transpose(self.get_clip(), pos, slide.rect.y, duration))
+    def get_visible_slides(self):
+        return sorted([slide for slide in self.sprites() if slide.visible],
+                      key=lambda slide: slide.index)
 
+    def get_slide_at(self, position):
+        for slide in reversed(self.get_visible_slides()):
+            if slide.rect.collidepoint(position):
+                return slide
+        return None
 
-class SlidesLayoutFade(SlidesLayout):
+    def place_slide(self, slide):
+        slide.set_position(self.rect.x + self.padding, self.rect.y + self.padding)
 
     def add_slide(self, slide):
         super(SlidesLayoutFade, self).add_slide(slide)
@@ -281,39 +707,118 @@ class SlidesLayoutFade(SlidesLayout):
             slide.visible = 0
 
     def update_slide_sizes(self):
+        width, height = self.rect.size
+        self.slide_size = (width - 2 * self.padding, height - 2 * self.padding)
         for slide in self.slides:
-            width, height = self.rect.size
             slide.set_position(self.rect.x + self.padding, self.rect.y + self.padding)
-            slide.set_size(width - 2 * self.padding, height - 2 * self.padding)
+            slide.set_size(*self.slide_size)
+
+    def get_strip_area(self):
+        return pygame.Rect((0, 0), self.get_clip().size)
+
+    def get_composite(self, slide):
+        """Return an opaque surface with the slide drawn over the background.
+        The last composites are kept while the slides are not rendered again.
+
+        :param slide: slide to draw
+        :type slide: :py:class:`Slide`
+        """
+        slide.render(True, self.fast_motion and self.is_animated())
+        composite = self._composites.get(slide.index)
+        if composite and composite[0] is slide.image and composite[1] == slide.selected:
+            return composite[2]
+
+        clip = self.get_clip()
+        surface = pygame.Surface(clip.size)
+        surface.blit(self._bgd, (0, 0), clip)
+        surface.blit(slide.image, (slide.rect.x - clip.x, slide.rect.y - clip.y))
+        self._composites[slide.index] = (slide.image, slide.selected, surface)
+        while len(self._composites) > 3:
+            self._composites.pop(next(iter(self._composites)))
+        return surface
+
+    def cross_fade(self, current, selected, duration):
+        """Fade from the current slide to the selected one. During the
+        transition, the opaque composite of the current slide is drawn then
+        the composite of the selected slide is blended over it. A running
+        cross fade is replaced.
+
+        :param current: slide currently displayed
+        :type current: :py:class:`Slide`
+        :param selected: slide to display
+        :type selected: :py:class:`Slide`
+        :param duration: animation duration in second (0 = instantaneous)
+        :type duration: int
+        """
+        # State at the end of the transition
+        current.set_alpha(255)
+        if current.visible:
+            current.visible = 0
+        selected.set_alpha(255)
+        if not selected.visible:
+            selected.visible = 1
+
+        self.scheduler.remove(self)
+        self._blended = (current, selected)
+        self.set_blend(0)
+        self.scheduler.add(self, anim.Blend(self.get_clip(), duration))
+
+    def set_blend(self, alpha):
+        """Set the alpha value of the selected slide blended over the
+        current one.
+
+        :param alpha: alpha value of the selected slide
+        :type alpha: int
+        """
+        # Composites are drawn again only if a slide has been rendered again
+        # (image decoded in background for instance)
+        self._strip = self.get_composite(self._blended[0])
+        self._strip.set_alpha(None)
+        self._blend_alpha = alpha
+
+    def draw(self, surface, *args, **kwargs):
+        rects = super(SlidesLayoutFade, self).draw(surface, *args, **kwargs)
+        if self._strip is not None and self._blended:
+            clip = self.get_clip()
+            composite = self.get_composite(self._blended[1])
+            composite.set_alpha(self._blend_alpha if self._blend_alpha < 255 else None)
+            surface.blit(composite, clip)
+        return rects
 
     def go_to_selection_forward(self, duration, center=False):
         current = self.get_visible_slides()[0]
+        selected = self.slides[self.selection]
+        if duration > 0 and self._bgd:
+            return self.cross_fade(current, selected, duration)
+
         if not current.visible:
             current.visible = 1
-        selected = self.slides[self.selection]
         if not selected.visible:
             selected.visible = 1
 
         if current == self.slides[-1]:
             selected.set_alpha(255)
-            current.add_animation(anim.Fade(self.get_clip(), 0, duration))
+            self.scheduler.add(current, anim.Fade(self.get_clip(), 0, duration))
         else:
-            current.add_animation(anim.Exit(self.get_clip(), duration))
+            self.scheduler.add(current, anim.Exit(self.get_clip(), duration))
             selected.set_alpha(0)
-            selected.add_animation(anim.Fade(self.get_clip(), 255, duration, False))
+            self.scheduler.add(selected, anim.Fade(self.get_clip(), 255, duration, False))
 
     def go_to_selection_backward(self, duration, center=False):
         current = self.get_visible_slides()[0]
+        selected = self.slides[self.selection]
+        if duration > 0 and self._bgd:
+            return self.cross_fade(current, selected, duration)
+
         if not current.visible:
             current.visible = 1
-        selected = self.slides[self.selection]
         if not selected.visible:
             selected.visible = 1
 
         if current == self.slides[0]:
-            current.add_animation(anim.Exit(self.get_clip(), duration))
+            self.scheduler.add(current, anim.Exit(self.get_clip(), duration))
             selected.set_alpha(0)
-            selected.add_animation(anim.Fade(self.get_clip(), 255, duration, False))
+            self.scheduler.add(selected, anim.Fade(self.get_clip(), 255, duration, False))
         else:
             selected.set_alpha(255)
-            current.add_animation(anim.Fade(self.get_clip(), 0, duration))
+            self.scheduler.add(current, anim.Fade(self.get_clip(), 0, duration))
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+from collections import OrderedDict
 import pygame
+from .cache import ASSETS
 
 
 def colorize(image, color):
@@ -22,6 +24,58 @@ def colorize(image, color):
     return image
 
 
+def scale_buffer(buffer, size, scaled_size):
+    """Scale an image given as RGBA pixels, this function can be executed
+    in another process.
+
+    :param buffer: RGBA pixels of the image
+    :type buffer: bytes
+    :param size: size of the image
+    :type size: tuple
+    :param scaled_size: size of the scaled image
+    :type scaled_size: tuple
+
+    :return: RGBA pixels of the scaled image
+    """
+    image = pygame.image.frombuffer(buffer, size, 'RGBA')
+    return pygame.image.tostring(pygame.transform.smoothscale(image, scaled_size), 'RGBA')
+
+
+def get_pyramid(image, max_size=None, min_size=32):
+    """Return the power-of-two downsampled levels of an image, from the
+    largest to the smallest. The levels larger than needed to fill an area
+    of ``max_size`` are not kept (the image itself may not be kept).
+
+    :param image: image to downsample
+    :type image: :py:class:`pygame.Surface`
+    :param max_size: size of the largest area to fill (None to keep all levels)
+    :type max_size: tuple
+    :param min_size: minimum width and height of the smallest level
+    :type min_size: int
+    """
+    levels = [image]
+    while True:
+        width, height = levels[-1].get_size()
+        if width // 2 < min_size or height // 2 < min_size:
+            break
+        levels.append(pygame.transform.smoothscale(levels[-1], (width // 2, height // 2)))
+        if max_size and (width // 2 >= max_size[0] or height // 2 >= max_size[1]):
+            # An image fitting in max_size can be scaled from the new level
+            levels.pop(0)
+    return levels
+
+
+def has_alpha_channel(surface):
+    """Return True if the surface has per-pixel alpha. The SRCALPHA flag can
+    not be used: pygame also reports it for a surface without alpha channel
+    once a surface alpha is set.
+
+    :param surface: surface to check
+    :type surface: :py:class:`pygame.Surface`
+    """
+    return surface.get_masks()[3] != 0
+
+
 def get_roundrect_shape(rect, radius=0.1, width=0):
     """Return a rounded rectangle shape.
 
@@ -92,7 +146,8 @@ class ImSliderRenderer(object):
                  selection_color,
                  selection_page_color,
                  background_color,
-                 slide_padding=10):
+                 slide_padding=10,
+                 assets=None):
         """VKeyboardStyle default constructor.
 
         Some parameters take a list of color tuples, one per state.
@@ -105,6 +160,7 @@ class ImSliderRenderer(object):
         :param selection_page_color: RGB tuple for selected page color
         :param background_color: RGB tuple for background color
         :param slide_padding: border between slide and image
+        :param assets: registry of the icons (shared by all renderers if None)
         """
         self.arrow_color = arrow_color
         self.dot_color = dot_color
@@ -113,6 +169,120 @@ class ImSliderRenderer(object):
         self.selection_page_color = selection_page_color
         self.background_color = background_color
         self.slide_padding = slide_padding
+        self.assets = ASSETS if assets is None else assets
+        # Shapes are shared between all sprites drawn by this renderer
+        self.memo_size = 64
+        self._memo = OrderedDict()
+
+    def _memoize(self, key, build):
+        """Return the surface stored for the given key, build it if it is not
+        yet memoized. The least recently used surfaces are discarded when
+        more than ``memo_size`` surfaces are stored.
+
+        The returned surface is shared, it shall not be modified.
+        """
+        surface = self._memo.get(key)
+        if surface is None:
+            surface = build()
+            self._memo[key] = surface
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(key)
+        return surface
+
+    def get_frame(self, size, color, radius=0.2, width=0):
+        """Return a rounded rectangle shape filled with the given color.
+
+        :param size: size of the shape
+        :type size: tuple
+        :param color: RGB color of the shape (None for a transparent shape)
+        :type color: tuple
+        :param radius: radius of the rounded corners (see :py:func:`get_roundrect_shape`)
+        :type radius: float
+        :param width: line thickness (0 to fill the rectangle)
+        :type width: int
+        """
+        if color is None:
+            return self._memoize(('frame', tuple(size), radius),
+                                 lambda: pygame.Surface(size, pygame.SRCALPHA, 32))
+        return self._memoize(('frame', tuple(size), radius, width, tuple(color)),
+                             lambda: colorize(get_roundrect_shape((0, 0, *size), radius, width), color))
+
+    def get_icon(self, image, size, color=None):
+        """Return the image scaled to the given size and colorized with the
+        given color. The icons are stored in the assets registry, they are
+        shared with the other renderers using the same registry.
+
+        :param image: source image of the icon
+        :type image: :py:class:`pygame.Surface`
+        :param size: size of the icon
+        :type size: tuple
+        :param color: RGB color of the icon (None to keep original colors)
+        :type color: tuple
+        """
+        def build():
+            if color is None:
+                icon = pygame.transform.smoothscale(image, size)
+            else:
+                icon = colorize(self.get_icon(image, size), color)
+            # The source image is stored with the icon to ensure that its
+            # id is not reused while the key is memoized
+            return (image, icon)
+
+        return self.assets.get(('icon', id(image), tuple(size), color and tuple(color)), build)[1]
+
+    def is_opaque(self):
+        """Return True if the surfaces drawn by this renderer have no
+        transparent pixel (the background color is defined and opaque).
+        """
+        return self.background_color is not None\
+            and (len(self.background_color) < 4 or self.background_color[3] == 255)
+
+    def create_surface(self, size):
+        """Return a new surface for a sprite of the given size. If the
+        renderer is opaque, the surface is in the display format without
+        alpha channel (faster blits), else it has per-pixel alpha.
+
+        :param size: size of the surface
+        :type size: tuple
+        """
+        if self.is_opaque():
+            return pygame.Surface(size)  # Match the display format
+        return pygame.Surface(size, pygame.SRCALPHA, 32)
+
+    def clear_surface(self, surface):
+        """Fill the surface with the background color (or make it
+        transparent if it has per-pixel alpha).
+
+        :param surface: surface to clear
+        :type surface: :py:class:`pygame.Surface`
+        """
+        if has_alpha_channel(surface) or self.background_color is None:
+            surface.fill((0, 0, 0, 0))
+        else:
+            surface.fill(self.background_color)
+
+    @staticmethod
+    def set_surface_alpha(surface, alpha, static=False):
+        """Set the alpha value of a drawn surface and select the fastest blit
+        for it: no blending for an opaque surface at full alpha, RLE
+        acceleration for a static surface with per-pixel alpha (a surface
+        drawn again would be decoded and encoded again).
+
+        :param surface: surface to update
+        :type surface: :py:class:`pygame.Surface`
+        :param alpha: alpha value between 0 (transparent) and 255 (opaque)
+        :type alpha: int
+        :param static: the surface is not drawn again
+        :type static: bool
+        """
+        if has_alpha_channel(surface):
+            surface.set_alpha(alpha, pygame.RLEACCEL if static else 0)
+        elif alpha >= 255:
+            surface.set_alpha(None)
+        else:
+            surface.set_alpha(alpha)
 
     def draw_arrow(self, surface, arrow):
         """Draw an arrow.
@@ -123,16 +293,12 @@ class ImSliderRenderer(object):
         :type arrow: :py:class:`Arrow`
         """
         fit_to_rect = arrow.image_source.get_rect().fit(surface.get_rect())
-        fit_to_rect.center = surface.get_rect().center
-        scaled = pygame.transform.smoothscale(arrow.image_source, fit_to_rect.size)
-        arrow.shape = colorize(scaled, self.arrow_color[0])
-        arrow.shape_pressed = colorize(scaled, self.arrow_color[1])
+        arrow.shape = self.get_icon(arrow.image_source, fit_to_rect.size, self.arrow_color[0])
+        arrow.shape_pressed = self.get_icon(arrow.image_source, fit_to_rect.size, self.arrow_color[1])
 
-        if self.background_color is None:
-            surface.fill((255, 255, 255, 0))
-        else:
-            surface.fill(self.background_color)
+        self.clear_surface(surface)
         surface.blit(arrow.shape, arrow.shape.get_rect(center=surface.get_rect().center))
+        self.set_surface_alpha(surface, 255)
 
     def draw_arrow_state(self, surface, arrow):
         """Draw arrow state.
@@ -142,15 +308,13 @@ class ImSliderRenderer(object):
         :param arrow: arrow to draw
         :type arrow: :py:class:`Arrow`
         """
-        if self.background_color is None:
-            surface.fill((255, 255, 255, 0))
-        else:
-            surface.fill(self.background_color)
+        self.clear_surface(surface)
         if arrow.pressed:
             image = arrow.shape_pressed
         else:
             image = arrow.shape
         surface.blit(image, image.get_rect(center=surface.get_rect().center))
+        self.set_surface_alpha(surface, 255)
 
     def draw_dot(self, surface, dot):
         """Draw a dot.
@@ -161,17 +325,13 @@ class ImSliderRenderer(object):
         :type dot: :py:class:`Dot`
         """
         fit_to_rect = dot.image_source.get_rect().fit(surface.get_rect())
-        fit_to_rect.center = surface.get_rect().center
-        scaled = pygame.transform.smoothscale(dot.image_source, fit_to_rect.size)
-        dot.shape = colorize(scaled, self.dot_color[0])
-        dot.shape_pressed = colorize(scaled, self.dot_color[1])
-        dot.shape_selected = colorize(scaled, self.selection_page_color)
-
-        if self.background_color is None:
-            surface.fill((255, 255, 255, 0))
-        else:
-            surface.fill(self.background_color)
+        dot.shape = self.get_icon(dot.image_source, fit_to_rect.size, self.dot_color[0])
+        dot.shape_pressed = self.get_icon(dot.image_source, fit_to_rect.size, self.dot_color[1])
+        dot.shape_selected = self.get_icon(dot.image_source, fit_to_rect.size, self.selection_page_color)
+
+        self.clear_surface(surface)
         surface.blit(dot.shape, dot.shape.get_rect(center=surface.get_rect().center))
+        self.set_surface_alpha(surface, 255)
 
     def draw_dot_state(self, surface, dot):
         """Draw dot state.
@@ -181,10 +341,7 @@ class ImSliderRenderer(object):
         :param dot: dot to draw
         :type dot: :py:class:`Dot`
         """
-        if self.background_color is None:
-            surface.fill((255, 255, 255, 0))
-        else:
-            surface.fill(self.background_color)
+        self.clear_surface(surface)
         if dot.pressed:
             image = dot.shape_pressed
         elif dot.selected:
@@ -192,6 +349,35 @@ class ImSliderRenderer(object):
         else:
             image = dot.shape
         surface.blit(image, image.get_rect(center=surface.get_rect().center))
+        self.set_surface_alpha(surface, 255)
+
+    def get_scaled_size(self, image_size, size):
+        """Return the size of an image scaled to fit in a slide.
+
+        :param image_size: size of the image
+        :type image_size: tuple
+        :param size: size of the slide
+        :type size: tuple
+        """
+        fit_to_rect = pygame.Rect((0, 0), image_size).fit(pygame.Rect((0, 0), size))
+        return fit_to_rect.inflate(-self.slide_padding, -self.slide_padding).size
+
+    def scale_slide_image(self, image, size, smooth=True):
+        """Return the image scaled to fit in a slide.
+
+        :param image: image to scale
+        :type image: :py:class:`pygame.Surface`
+        :param size: size of the slide
+        :type size: tuple
+        :param smooth: if False, use a fast low quality scaling
+        :type smooth: bool
+
+        :return: scaled image
+        """
+        scaled_size = self.get_scaled_size(image.get_size(), size)
+        if not smooth:
+            return pygame.transform.scale(image, scaled_size)
+        return pygame.transform.smoothscale(image, scaled_size)
 
     def draw_slide(self, surface, slide):
         """Draw a slide.
@@ -203,21 +389,29 @@ class ImSliderRenderer(object):
 
         :return: scaled image for next blit without resize
         """
-        fit_to_rect = slide.image_source.get_rect().fit(surface.get_rect())
-        fit_to_rect = fit_to_rect.inflate(-self.slide_padding, -self.slide_padding)
-        fit_to_rect.center = surface.get_rect().center
-        slide.scaled = pygame.transform.smoothscale(slide.image_source, fit_to_rect.size)
-        shape = get_roundrect_shape(surface.get_rect(), 0.2)
-        slide.shape_selected = colorize(shape, self.selection_color)
-        if self.slide_color is not None:
-            slide.shape = colorize(shape, self.slide_color)
-        else:
-            # Slide is transparent
-            slide.shape = surface.copy()
-            slide.shape.fill((0, 0, 0, 0))
+        slide.scaled = slide.get_scaled_image(surface.get_size())
+        slide.shape_selected = self.get_frame(surface.get_size(), self.selection_color)
+        slide.shape = self.get_frame(surface.get_size(), self.slide_color)
 
         self.draw_slide_state(surface, slide)
 
+    def draw_slide_placeholder(self, surface, slide):
+        """Draw a slide which image is not yet loaded.
+
+        :param surface: surface background should be drawn in
+        :type surface: :py:class:`pygame.Surface`
+        :param slide: slide to draw
+        :type slide: :py:class:`Slide`
+        """
+        self.clear_surface(surface)
+        if slide.selected:
+            color = self.selection_color
+        else:
+            color = self.slide_color
+        if color is not None:
+            surface.blit(self.get_frame(surface.get_size(), color), (0, 0))
+        self.set_surface_alpha(surface, slide.alpha)
+
     def draw_slide_state(self, surface, slide):
         """Draw selection around the slide.
         :param surface: surface background should be drawn in
@@ -225,13 +419,13 @@ class ImSliderRenderer(object):
         :param slide: slide to draw
         :type slide: :py:class:`Slide`
         """
-        surface.fill((0, 0, 0, 0))  # Clear the current slide
+        self.clear_surface(surface)  # Clear the current slide
         if slide.selected:
             surface.blit(slide.shape_selected, (0, 0))
         else:
             surface.blit(slide.shape, (0, 0))
         surface.blit(slide.scaled, slide.scaled.get_rect(center=surface.get_rect().center))
-        surface.set_alpha(slide.alpha)
+        self.set_surface_alpha(surface, slide.alpha)
 
     def draw_background(self, surface):
         """Draw background.
@@ -244,6 +438,7 @@ class ImSliderRenderer(object):
         """
         if self.background_color is not None:
             surface.fill(self.background_color)
+        self.set_surface_alpha(surface, 255, True)
 
 
 ImSliderRenderer.DEFAULT = ImSliderRenderer(
@@ -2,9 +2,10 @@
 
 import math
 import os.path as osp
+from concurrent import futures
 import pygame
 from .layouts import SlidesLayout, SlidesLayoutLoop, SlidesLayoutFade
-from .sprites import Background, Arrow, Slide, Dot
+from .sprites import Background, Arrow, Slide, Pagination
 from .renderers import ImSliderRenderer
 
 HERE = osp.dirname(osp.abspath(__file__))
@@ -49,12 +50,56 @@ class ImSlider(object):
     :type renderer: :py:class:`ImSliderRenderer`
     :param callback: callback called each time the selection is changed.
     :type callback: function
+    :param preload: number of slides decoded before and after the visible ones
+                    when images are lazy loaded.
+    :type preload: int
+    :param cache: cache used to store the decoded images (can be shared by
+                  several sliders).
+    :type cache: :py:class:`SurfaceCache`
+    :param disk_cache: cache used to store the images scaled to the slides size
+                       across application restarts.
+    :type disk_cache: :py:class:`DiskCache`
+    :param compose_strip: draw the moving slides from one surface composed at the
+                          beginning of the transition (one blit per frame).
+                          Ignored if stype=STYPE_FADE.
+    :type compose_strip: bool
+    :param native_depth: keep the images without transparency and the eraser in
+                         the pixel format and depth of the display (16 bits on
+                         some framebuffers), they are converted once when scaled.
+                         On a 16 bits display, the decoded images stay in 32 bits
+                         (smoothscale needs a 24 or 32 bits source).
+    :type native_depth: bool
+    :param render_executor: executor used to scale the images of the slides in
+                            parallel when several slides are rendered at once
+                            (a thread or a process pool).
+    :type render_executor: :py:class:`concurrent.futures.Executor`
+    :param fast_motion: render the slides appearing during a transition with a
+                        fast scaling, the visible ones are rendered again with
+                        a smooth scaling when the transition is finished.
+    :type fast_motion: bool
+    :param pyramid: scale the images from power-of-two downsampled levels (the
+                    full resolution images are released once the levels are built).
+    :type pyramid: bool
+    :param full_resolution: decode the image files at full resolution instead
+                            of downsampling them to twice the slide size (needed
+                            if :py:meth:`ImSlider.get_image` shall return the
+                            original image).
+    :type full_resolution: bool
     """
 
     def __init__(self, size, stype=STYPE_SLIDE, per_page=1, per_move=0, focus=True, rewind=False,
-                 speed=0.4, renderer=ImSliderRenderer.DEFAULT, callback=None):
+                 speed=0.4, renderer=ImSliderRenderer.DEFAULT, callback=None, preload=2, cache=None,
+                 disk_cache=None, compose_strip=False, native_depth=False, render_executor=None,
+                 fast_motion=False, pyramid=False, full_resolution=False):
         self._per_page = per_page
         self._per_move = per_move
+        self.preload = preload
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.native_depth = native_depth
+        self.pyramid = pyramid
+        self.full_resolution = full_resolution
+        self.executor = None
         self.eraser = None
         self.clock = pygame.time.Clock()
         self.stype = stype
@@ -67,6 +112,9 @@ class ImSlider(object):
             self.layout = SlidesLayoutFade(self.per_page, self.focus)
         else:
             self.layout = SlidesLayout(self.per_page, self.focus)
+        self.layout.compose = compose_strip
+        self.layout.executor = render_executor
+        self.layout.fast_motion = fast_motion
 
         self.callback = callback
         self.renderer = renderer
@@ -76,11 +124,27 @@ class ImSlider(object):
         self.arrows = (Arrow(osp.join(HERE, "left.png"), self.renderer, pygame.K_LEFT),
                        Arrow(osp.join(HERE, "right.png"), self.renderer, pygame.K_RIGHT))
         self.pressed_repeat_time = 0.4
+        # Maximum time elapsed in the first update after an idle period
+        self.wake_time = 0.05
+        self._idle = False
+
+        self.pagination = Pagination(osp.join(HERE, "dot.png"), self.renderer)
+
+        # Handlers of the processed events by event type, a handler returns
+        # the list of the actions triggered by the event
+        self._handlers = {pygame.MOUSEBUTTONDOWN: self._on_pointer_down,
+                          pygame.MOUSEBUTTONUP: self._on_pointer_up,
+                          pygame.FINGERDOWN: self._on_pointer_down,
+                          pygame.FINGERUP: self._on_pointer_up,
+                          pygame.KEYDOWN: self._on_key_down,
+                          pygame.KEYUP: self._on_key_up,
+                          pygame.JOYHATMOTION: self._on_joyhat_motion}
 
         self.sprites = pygame.sprite.LayeredDirty()
         self.sprites.add(self.background, layer=0)
         for arrow in self.arrows:
             self.sprites.add(arrow, layer=1)
+        self.sprites.add(self.pagination, layer=2)
 
         self.set_size(*size)
 
@@ -98,59 +162,69 @@ class ImSlider(object):
     def per_move(self):
         return self._per_move if self._per_move != 0 else self._per_page
 
-    def load_images(self, images, lazy=False):
+    def load_images(self, images, lazy=False, threaded=False):
         """Load the images.
 
         :param images: sequence of images
         :type images: list
-        :param lazy: load images only when needed
+        :param lazy: load images only when they are close to the selection
         :type lazy: bool
+        :param threaded: decode images in background threads, a placeholder
+                         is displayed until the image is ready (the threads
+                         are shared by the next loads, see :py:meth:`ImSlider.close`)
+        :type threaded: bool
         """
         size = self.get_rect().size
         self.layout.empty()
+        self.layout.preload = self.preload if lazy else None
+        if threaded and not self.executor:
+            self.executor = futures.ThreadPoolExecutor(thread_name_prefix='imslider')
         for image in images:
-            self.layout.add_slide(Slide(image, self.renderer, not lazy))
+            self.layout.add_slide(Slide(image, self.renderer, not lazy,
+                                        executor=self.executor if threaded else None,
+                                        cache=self.cache, disk_cache=self.disk_cache,
+                                        native=self.native_depth, pyramid=self.pyramid,
+                                        decode_size=None if self.full_resolution else self.layout.slide_size))
         self.layout.set_position(self.background.rect.x + self.arrows[0].rect.width, self.background.rect.y)
         self.layout.set_size(size[0] - 2 * self.arrows[0].rect.width, size[1])
         self.layout.set_selection(pos=0)
 
-        self.sprites.remove_sprites_of_layer(2)
         self.setup_pagination()
 
         self.update_arrows()
         self.update_pages()
 
+    def close(self):
+        """Release the images and stop the threads decoding the images in
+        background. The images shall be loaded again to use the slider.
+        """
+        self.load_images([])
+        if self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
     def set_eraser(self, surface):
         """Setup the surface used to hide/clear the slider.
         """
-        self.eraser = surface.copy()
+        if self.native_depth and not surface.get_flags() & pygame.SRCALPHA:
+            self.eraser = surface.convert()  # Display format
+        else:
+            self.eraser = surface.copy()
         self.sprites.clear(None, self.eraser)
         self.layout.clear(None, self.eraser)
 
     def setup_pagination(self):
-        """Setup pagination indication (one dot per page).
+        """Setup pagination indication (one dot per page, only the dots
+        around the selected page are displayed if they do not fit in the
+        slides width).
         """
         nbr_pages = int(math.ceil(len(self.layout.slides) / self.per_page))
         y_margin = 4
         y = self.background.rect.bottom - self.layout.padding + y_margin
         dot_radius = self.layout.padding - 2 * y_margin
-        dots = self.sprites.get_sprites_from_layer(2)
-        x_margin = 5
-        x = self.background.rect.centerx - (dot_radius * nbr_pages + x_margin * (nbr_pages - 1)) // 2
-
-        # Update size of existing dots
-        for dot in dots:
-            dot.set_size(dot_radius, dot_radius)
-            dot.set_position(x, y)
-            x += dot.rect.width + x_margin
-
-        # Add missing dots
-        for i in range(max(0, nbr_pages - len(dots))):
-            dot = Dot(osp.join(HERE, "dot.png"), self.renderer)
-            self.sprites.add(dot, layer=2)
-            dot.set_size(dot_radius, dot_radius)
-            dot.set_position(x, y)
-            x += dot.rect.width + x_margin
+        self.pagination.set_count(nbr_pages)
+        self.pagination.set_size(self.layout.rect.width, dot_radius)
+        self.pagination.set_position(self.background.rect.centerx - self.pagination.rect.width // 2, y)
 
     def get_page_at(self, position):
         """Retrieve if any page-dot is located at the given position.
@@ -158,10 +232,115 @@ class ImSlider(object):
         :param position: position to check key at.
         :return: page index if any at the given position, None otherwise.
         """
-        for sprite in self.sprites.get_sprites_at(position):
-            if isinstance(sprite, Dot):
-                return self.sprites.get_sprites_from_layer(2).index(sprite)
-        return None
+        return self.pagination.get_page_at(position)
+
+    def is_handled_event(self, event):
+        """Return True if the given event is processed by the slider.
+
+        :param event: event to check
+        :type event: :py:class:`pygame.event.Event`
+        """
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            # Don't consider the mouse wheel (button 4 & 5)
+            return event.button in (1, 2, 3)
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            return any(event.key == arrow.pressed_key for arrow in self.arrows)
+        return event.type in self._handlers
+
+    def dispatch_events(self, events):
+        """Route the events to the handler of their type. The pressed state
+        of the arrows and the dots is updated immediately, the actions
+        triggered by the events (change of selection) are returned to be
+        executed later.
+
+        :param events: list of events to process.
+        :type events: list
+        :return: list of functions to call
+        :rtype: list
+        """
+        actions = []
+        display_size = None
+        for event in events:
+            handler = self._handlers.get(event.type)
+            if handler is None or not self.is_handled_event(event):
+                continue
+            if event.type in (pygame.FINGERDOWN, pygame.FINGERUP):
+                if display_size is None:
+                    display_size = pygame.display.get_surface().get_size()
+                pos = (event.x * display_size[0], event.y * display_size[1])
+            else:
+                pos = getattr(event, 'pos', None)
+            actions.extend(handler(event, pos))
+        return actions
+
+    def _on_pointer_down(self, event, pos):
+        actions = []
+        if self.arrows[0].visible and self.arrows[0].rect.collidepoint(pos):
+            self.arrows[0].set_pressed(1)
+            actions.append(self.on_previous)
+        elif self.arrows[1].visible and self.arrows[1].rect.collidepoint(pos):
+            self.arrows[1].set_pressed(1)
+            actions.append(self.on_next)
+
+        page = self.get_page_at(pos)
+        if page is not None:
+            self.pagination.set_pressed(page)
+            actions.append(lambda: self.set_index(self.per_page * page))
+        return actions
+
+    def _on_pointer_up(self, event, pos):
+        for arrow in self.arrows:
+            arrow.set_pressed(0)
+        self.pagination.set_pressed(None)
+        return []
+
+    def _on_key_down(self, event, pos):
+        if event.key == self.arrows[0].pressed_key:
+            self.arrows[0].set_pressed(1)
+            return [self.on_previous]
+        self.arrows[1].set_pressed(1)
+        return [self.on_next]
+
+    def _on_key_up(self, event, pos):
+        for arrow in self.arrows:
+            if event.key == arrow.pressed_key:
+                arrow.set_pressed(0)
+        return []
+
+    def _on_joyhat_motion(self, event, pos):
+        if self.arrows[0].visible and event.value == JOYHAT_LEFT:
+            return [self.on_previous]
+        elif self.arrows[1].visible and event.value == JOYHAT_RIGHT:
+            return [self.on_next]
+        return []
+
+    def needs_update(self, events=()):
+        """Return True if :py:meth:`ImSlider.update` has something to do: one
+        of the given events is processed by the slider, an animation is running,
+        an arrow is pressed or a sprite has to be rendered.
+
+        :param events: list of events to process.
+        :type events: list
+        """
+        if any(self.is_handled_event(event) for event in events):
+            return True
+        if self.layout.is_animated() or self.layout.is_resizing()\
+                or any(arrow.pressed for arrow in self.arrows):
+            return True
+        if self.background.needs_update() or self.pagination.needs_update():
+            return True
+        return any(slide.needs_update() for slide in self.layout)
+
+    def needs_redraw(self):
+        """Return True if :py:meth:`ImSlider.draw` has something to draw: a
+        sprite has changed or an area has to be repainted.
+        """
+        if self.layout.is_animated():
+            return True
+        for group in (self.sprites, self.layout):
+            if group.lostsprites or any(sprite.dirty for sprite in group):
+                return True
+        return False
 
     def get_rect(self):
         """Return slider rect."""
@@ -170,6 +349,9 @@ class ImSlider(object):
     def get_image(self, resized=False):
         """Return the :py:class:`Surface` of the currently selected image.
 
+        The image decoded from a file is downsampled to twice the slide size
+        unless the slider is created with ``full_resolution=True``.
+
         :param resized: if True, return the surface resized to fit the slide
         :type resized: bool
         """
@@ -178,6 +360,16 @@ class ImSlider(object):
             return slide.image
         return slide.image_source
 
+    def get_future(self, index):
+        """Return the :py:class:`concurrent.futures.Future` of the background
+        decoding of the image at the given index (None if the image is not
+        being decoded in background).
+
+        :param index: index of the image
+        :type index: int
+        """
+        return self.layout.slides[index].future
+
     def get_index(self):
         """Return the index of the currently selected image."""
         return self.layout.selection
@@ -199,18 +391,26 @@ class ImSlider(object):
             self.callback(self.layout.selection)
 
     def set_position(self, x, y):
-        """Set the background position.
+        """Set the slider position (the arrows, the slides and the page-dots
+        are moved with the background).
 
         :param x: position x
         :type x: int
         :param y: position y
         :type y: int
         """
-        self.background.set_position(x, y)
+        if self.background.rect.topleft != (int(x), int(y)):
+            self.background.set_position(x, y)
+            self.background.image = None  # Eraser shall be updated too
+            self.set_size(*self.background.rect.size)
 
     def set_size(self, width, height):
         """Resize the images slider according to the given size.
 
+        The visible slides are rendered first with a fast scaling, and again
+        with a good quality when the size has not changed for a short delay
+        (``layout.resize_delay``), so that a window drag stays fluid.
+
         :param width: slider width
         :type width: int
         :param height: slider height
@@ -229,7 +429,8 @@ class ImSlider(object):
                                     self.background.rect.centery - self.arrows[0].rect.height // 2)
 
         self.layout.set_position(self.background.rect.x + arrow_width, self.background.rect.y)
-        self.layout.set_size(width - 2 * arrow_width, height)
+        # Successive resizes (window drag) are rendered with a fast scaling
+        self.layout.set_size(width - 2 * arrow_width, height, True)
 
         self.setup_pagination()
 
@@ -259,6 +460,9 @@ class ImSlider(object):
         The `force` parameter shall be used if the surface has been redrawn:
         it redraws all sprites.
 
+        Nothing is drawn (and an empty list is returned) if no sprite has
+        changed since the last call.
+
         :param surface: surface the slider will be displayed at
         :type surface: object
         :param force: force the drawing of the entire surface (time consuming)
@@ -270,19 +474,37 @@ class ImSlider(object):
         if force:
             self.sprites.repaint_rect(self.background.rect)
             self.layout.repaint_rect(self.background.rect)
+        elif not self.needs_redraw():
+            return []
         rects = self.sprites.draw(surface)
         rects += self.layout.draw(surface)
         return rects
 
-    def update(self, events):
+    def update(self, events, dt=None):
         """Pygame events processing method.
 
+        The method returns immediately if the slider is idle (see
+        :py:meth:`ImSlider.needs_update`).
+
         :param events: list of events to process.
         :type events: list
+        :param dt: elapsed time in seconds since last call (measured by the
+                   slider clock if None)
+        :type dt: float
         """
-        dt = self.clock.tick() / 1000  # Amount of seconds between each loop.
+        if dt is None:
+            dt = self.clock.tick() / 1000  # Amount of seconds between each loop.
+        if not self.needs_update(events):
+            self._idle = True
+            return
+        if self._idle:
+            # The application may have been waiting for events, the idle
+            # time shall not be counted in the animations
+            self._idle = False
+            dt = min(dt, self.wake_time)
         update_eraser = self.background.image is None
         self.sprites.update(events, dt)
+        actions = self.dispatch_events(events)
         # Synchronize update method between groups
         self.layout._use_update = self.sprites._use_update
 
@@ -301,42 +523,8 @@ class ImSlider(object):
             self.layout.update(events, dt)
             return  # Right arrow stay pressed
 
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN\
-                    and event.button in (1, 2, 3):
-                # Don't consider the mouse wheel (button 4 & 5)
-                if self.arrows[0].visible and self.arrows[0].rect.collidepoint(event.pos):
-                    self.on_previous()
-                elif self.arrows[1].visible and self.arrows[1].rect.collidepoint(event.pos):
-                    self.on_next()
-
-                page = self.get_page_at(event.pos)
-                if page is not None:
-                    self.set_index(self.per_page * page)
-
-            elif event.type == pygame.FINGERDOWN:
-                display_size = pygame.display.get_surface().get_size()
-                finger_pos = (event.x * display_size[0], event.y * display_size[1])
-                if self.arrows[0].visible and self.arrows[0].rect.collidepoint(finger_pos):
-                    self.on_previous()
-                elif self.arrows[1].visible and self.arrows[1].rect.collidepoint(finger_pos):
-                    self.on_next()
-
-                page = self.get_page_at(finger_pos)
-                if page is not None:
-                    self.set_index(self.per_page * page)
-
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT:
-                    self.on_previous()
-                elif event.key == pygame.K_RIGHT:
-                    self.on_next()
-
-            elif event.type == pygame.JOYHATMOTION:
-                if self.arrows[0].visible and event.value == JOYHAT_LEFT:
-                    self.on_previous()
-                elif self.arrows[1].visible and event.value == JOYHAT_RIGHT:
-                    self.on_next()
+        for action in actions:
+            action()
 
         # Update will rebuild sprites images
         self.layout.update(events, dt)
@@ -345,8 +533,8 @@ class ImSlider(object):
         if update_eraser and not self.eraser:
             width, height = self.background.rect.size
             # Handle absolute position of the sprites
-            eraser = pygame.Surface((self.background.rect.x + width,
-                                     self.background.rect.y + height), pygame.SRCALPHA, 32)
+            eraser = self.renderer.create_surface((self.background.rect.x + width,
+                                                   self.background.rect.y + height))
             eraser.blit(self.background.image, self.background.rect.topleft)
             self.sprites.clear(None, eraser)
             self.layout.clear(None, eraser)
@@ -380,14 +568,7 @@ class ImSlider(object):
     def update_pages(self):
         """Update pages indication.
         """
-        current_page = self.layout.selection // self.per_page
-        count = 0
-        for dot in self.sprites.get_sprites_from_layer(2):
-            if count == current_page:
-                dot.set_selected(1)
-            else:
-                dot.set_selected(0)
-            count += 1
+        self.pagination.set_selected(self.layout.selection // self.per_page)
 
     def on_previous(self):
         """Go to previous slide.
@@ -1,6 +1,69 @@
 # -*- coding: utf-8 -*-
 
+from concurrent import futures
 import pygame
+from .renderers import scale_buffer, get_pyramid, has_alpha_channel
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None  # Images are decoded at full resolution by pygame
+
+
+def fit_size(size, max_size):
+    """Return the given size reduced to fit in ``max_size`` keeping its
+    aspect ratio (the size is never enlarged).
+
+    :param size: size to reduce
+    :type size: tuple
+    :param max_size: maximum size
+    :type max_size: tuple
+    """
+    if size[0] <= max_size[0] and size[1] <= max_size[1]:
+        return tuple(size)
+    return pygame.Rect((0, 0), size).fit(pygame.Rect((0, 0), max_size)).size
+
+
+def load_image(path, max_size=None):
+    """Decode an image file, downsampled to fit in ``max_size`` if given.
+
+    If Pillow is installed and the format allows it (JPEG DCT scaling), the
+    image is decoded at a reduced scale, else it is decoded at full resolution
+    by pygame and then scaled. The returned surface is not
+    converted, this function can be executed in a background thread.
+
+    :param path: path to the image file
+    :type path: str
+    :param max_size: maximum size of the decoded image (None for full resolution)
+    :type max_size: tuple
+    """
+    if max_size is None:
+        return pygame.image.load(path)
+    if Image is not None:
+        try:
+            with Image.open(path) as image:
+                # Only the codecs able to decode at a reduced scale are faster
+                # than pygame, the other formats are decoded by pygame
+                if image.draft(None, max_size):
+                    image.thumbnail(max_size, Image.BILINEAR, reducing_gap=None)
+                    mode = 'RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB'
+                    if image.mode != mode:
+                        image = image.convert(mode)
+                    return pygame.image.fromstring(image.tobytes(), image.size, mode)
+        except (OSError, ValueError):
+            pass  # Format not supported by Pillow, try with pygame
+    surface = pygame.image.load(path)
+    size = fit_size(surface.get_size(), max_size)
+    if size != surface.get_size():
+        if surface.get_bitsize() not in (24, 32):
+            # Smoothscale needs a 24 or 32 bits surface, a palette image is
+            # expanded (the transparent color key becomes per-pixel alpha)
+            flags = pygame.SRCALPHA if surface.get_colorkey() is not None else 0
+            expanded = pygame.Surface(surface.get_size(), flags, 32)
+            expanded.blit(surface, (0, 0))
+            surface = expanded
+        surface = pygame.transform.smoothscale(surface, size)
+    return surface
 
 
 class Background(pygame.sprite.DirtySprite):
@@ -52,9 +115,14 @@ class Background(pygame.sprite.DirtySprite):
         :type dt: int
         """
         if self.image is None:
-            self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA, 32)
+            self.image = self.renderer.create_surface(self.rect.size)
             self.renderer.draw_background(self.image)
 
+    def needs_update(self):
+        """Return True if the background has to be rendered.
+        """
+        return self.image is None
+
 
 class Arrow(pygame.sprite.DirtySprite):
     """
@@ -82,8 +150,8 @@ class Arrow(pygame.sprite.DirtySprite):
         self.pressed_key = pressed_key
         self.pressed_time = 0
         self.rect = pygame.Rect((0, 0), (10, 10))
-        self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA, 32)
-        self.image_source = pygame.image.load(arrow_path).convert_alpha()
+        self.image = self.renderer.create_surface(self.rect.size)
+        self.image_source = self.renderer.assets.load(arrow_path)
 
     def set_position(self, x, y):
         """Set the arrow position.
@@ -107,7 +175,7 @@ class Arrow(pygame.sprite.DirtySprite):
         """
         if self.rect.size != (int(width), int(height)):
             self.rect.size = (int(width), int(height))
-            self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA, 32)
+            self.image = self.renderer.create_surface(self.rect.size)
             self.renderer.draw_arrow(self.image, self)
             self.dirty = 1
 
@@ -121,9 +189,12 @@ class Arrow(pygame.sprite.DirtySprite):
             self.pressed = int(state)
             self.renderer.draw_arrow_state(self.image, self)
             self.dirty = 1
+        if not self.pressed:
+            self.pressed_time = 0
 
     def update(self, events, dt):
-        """Pygame events processing method.
+        """Update the time the arrow is pressed (the events are dispatched
+        by the slider).
 
         :param events: list of events to process.
         :type events: list
@@ -133,48 +204,17 @@ class Arrow(pygame.sprite.DirtySprite):
         if self.pressed:
             self.pressed_time += dt
 
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN\
-                    and event.button in (1, 2, 3):
-                # Don't consider the mouse wheel (button 4 & 5):
-                if self.rect.collidepoint(event.pos) and self.visible:
-                    self.set_pressed(1)
-            elif event.type == pygame.MOUSEBUTTONUP\
-                    and event.button in (1, 2, 3):
-                # Don't consider the mouse wheel (button 4 & 5):
-                self.set_pressed(0)
-                self.pressed_time = 0
-            elif event.type == pygame.FINGERDOWN:
-                display_size = pygame.display.get_surface().get_size()
-                finger_pos = (event.x * display_size[0], event.y * display_size[1])
-                if self.rect.collidepoint(finger_pos) and self.visible:
-                    self.set_pressed(1)
-            elif event.type == pygame.FINGERUP:
-                self.set_pressed(0)
-                self.pressed_time = 0
-            elif event.type == pygame.KEYDOWN:
-                if event.key == self.pressed_key:
-                    self.set_pressed(1)
-            elif event.type == pygame.KEYUP:
-                if event.key == self.pressed_key:
-                    self.set_pressed(0)
-                    self.pressed_time = 0
-
 
 class Dot(pygame.sprite.DirtySprite):
 
-    image_source = None
-
     def __init__(self, dot_path, renderer):
         super(Dot, self).__init__()
         self.renderer = renderer
         self.pressed = 0
         self.selected = 0
         self.rect = pygame.Rect((0, 0), (10, 10))
-        self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA, 32)
-        if not Dot.image_source:
-            # Load image only one time to save memory
-            Dot.image_source = pygame.image.load(dot_path).convert_alpha()
+        self.image = self.renderer.create_surface(self.rect.size)
+        self.image_source = self.renderer.assets.load(dot_path)
 
     def set_position(self, x, y):
         """Set the dot position.
@@ -198,7 +238,7 @@ class Dot(pygame.sprite.DirtySprite):
         """
         if self.rect.size != (int(width), int(height)):
             self.rect.size = (int(width), int(height))
-            self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA, 32)
+            self.image = self.renderer.create_surface(self.rect.size)
             self.renderer.draw_dot(self.image, self)
             self.dirty = 1
 
@@ -224,31 +264,226 @@ class Dot(pygame.sprite.DirtySprite):
             self.renderer.draw_dot_state(self.image, self)
             self.dirty = 1
 
+
+class Pagination(pygame.sprite.DirtySprite):
+
+    """
+    Pagination sprite.
+
+    Draw the row of page-dots in one surface. Only the dots of a window
+    around the selected page are displayed when all the dots do not fit
+    in the available width. The dots are copied from an atlas holding one
+    dot per state (released, pressed, selected).
+    """
+
+    RELEASED, PRESSED, SELECTED = range(3)
+
+    def __init__(self, dot_path, renderer):
+        """
+        :param dot_path: path to the dot image shape
+        :type dot_path: str
+        :param renderer: render used to render the dots
+        :type renderer: :py:class:`SliderRenderer`
+        """
+        super(Pagination, self).__init__()
+        self.renderer = renderer
+        self.rect = pygame.Rect((0, 0), (0, 0))
+        self.image = None
+        self.dot = Dot(dot_path, renderer)
+        self.atlas = None
+        self.margin = 5
+        self.max_width = 0
+        self.count = 0
+        self.capacity = 0
+        self.first = 0
+        self.selected = 0
+        self.pressed = None
+        self.visible = 0
+
+    @property
+    def dot_size(self):
+        return self.rect.height
+
+    @property
+    def pitch(self):
+        return max(1, self.dot_size + self.margin)
+
+    def set_position(self, x, y):
+        """Set the pagination position.
+
+        :param x: position x
+        :type x: int
+        :param y: position y
+        :type y: int
+        """
+        if self.rect.topleft != (int(x), int(y)):
+            self.rect.topleft = (int(x), int(y))
+            self.dirty = 1
+
+    def set_size(self, max_width, dot_size):
+        """Set the size of the dots and the maximum width of the row.
+
+        :param max_width: maximum width of the row of dots
+        :type max_width: int
+        :param dot_size: dot width and height
+        :type dot_size: int
+        """
+        if self.rect.height != int(dot_size) or self.max_width != int(max_width):
+            self.rect.height = int(dot_size)
+            self.max_width = int(max_width)
+            self.atlas = None  # Force rendering
+            self.update_window()
+
+    def set_count(self, count):
+        """Set the number of pages.
+
+        :param count: number of pages
+        :type count: int
+        """
+        if self.count != int(count):
+            self.count = int(count)
+            self.selected = min(self.selected, max(0, self.count - 1))
+            self.pressed = None
+            self.update_window()
+
+    def update_window(self):
+        """Compute the number of displayed dots and the first displayed page.
+        """
+        self.capacity = max(1, (self.max_width + self.margin) // self.pitch)
+        self.first = 0
+        self.move_window(self.selected)
+        nbr = min(self.count, self.capacity)
+        self.rect.width = max(0, nbr * self.pitch - self.margin)
+        self.image = None  # Force rendering
+        self.dirty = 1
+        visible = int(self.count > 0)
+        if self.visible != visible:
+            self.visible = visible
+
+    def move_window(self, page):
+        """Move the window of displayed dots to make the given page visible
+        (a dot is kept visible around the page if possible). Return True if
+        the window has moved.
+
+        :param page: page to display
+        :type page: int
+        """
+        if self.count <= self.capacity:
+            return False
+        last = self.first + self.capacity - 1
+        if self.first <= page <= last and (self.first < page or page == 0)\
+                and (page < last or page == self.count - 1):
+            return False
+        self.first = min(max(0, page - self.capacity // 2), self.count - self.capacity)
+        return True
+
+    def get_page_at(self, position):
+        """Return the page of the dot at the given position, None if there
+        is no dot. The page is computed from the geometry of the row.
+
+        :param position: position to check dot at
+        :type position: tuple
+        """
+        if not self.visible or not self.rect.collidepoint(position):
+            return None
+        index, x = divmod(int(position[0]) - self.rect.x, self.pitch)
+        if x < self.dot_size and self.first + index < self.count:
+            return self.first + index
+        return None
+
+    def get_state(self, page):
+        if page == self.pressed:
+            return self.PRESSED
+        if page == self.selected:
+            return self.SELECTED
+        return self.RELEASED
+
+    def set_selected(self, page):
+        """Set the selected page and redraw the dots which have changed.
+
+        :param page: selected page
+        :type page: int
+        """
+        if self.selected != page:
+            previous, self.selected = self.selected, page
+            self.draw_pages(previous, page)
+
+    def set_pressed(self, page):
+        """Set the pressed page (None to release it) and redraw the dots which
+        have changed.
+
+        :param page: pressed page
+        :type page: int
+        """
+        if self.pressed != page:
+            previous, self.pressed = self.pressed, page
+            self.draw_pages(previous, page)
+
+    def draw_pages(self, *pages):
+        """Redraw the dots of the given pages (None values are ignored), all
+        dots are drawn again if the window has moved.
+        """
+        if self.image is None:
+            return  # Will be fully rendered at next update
+        if self.move_window(self.selected):
+            self.draw_all()
+        else:
+            for page in pages:
+                if page is not None and self.first <= page < self.first + self.capacity:
+                    self.draw_dot(page)
+        self.renderer.set_surface_alpha(self.image, 255)
+        self.dirty = 1
+
+    def render_atlas(self):
+        """Render the dot in each state using the renderer.
+        """
+        size = self.dot_size
+        self.atlas = self.renderer.create_surface((3 * size, size))
+        self.dot.set_size(size, size)
+        # The shapes are not drawn by set_size() if the dot has already this size
+        self.renderer.draw_dot(self.dot.image, self.dot)
+        for state in (self.RELEASED, self.PRESSED, self.SELECTED):
+            self.dot.set_pressed(state == self.PRESSED)
+            self.dot.set_selected(state == self.SELECTED)
+            self.copy(self.atlas, self.dot.image, (state * size, 0))
+
+    def copy(self, surface, source, pos, area=None):
+        if has_alpha_channel(surface):
+            # Copy pixels without blending
+            surface.fill((0, 0, 0, 0), pygame.Rect(pos, source.get_size() if area is None else area.size))
+            surface.blit(source, pos, area, pygame.BLEND_RGBA_MAX)
+        else:
+            surface.blit(source, pos, area)
+
+    def draw_dot(self, page):
+        size = self.dot_size
+        area = pygame.Rect(self.get_state(page) * size, 0, size, size)
+        self.copy(self.image, self.atlas, ((page - self.first) * self.pitch, 0), area)
+
+    def draw_all(self):
+        self.renderer.clear_surface(self.image)
+        for page in range(self.first, min(self.count, self.first + self.capacity)):
+            self.draw_dot(page)
+
     def update(self, events, dt):
-        """Pygame events processing method.
+        """Render the dots if necessary.
 
         :param events: list of events to process.
         :type events: list
         :param dt: elapsed time since last call
         :type dt: int
         """
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN\
-                    and event.button in (1, 2, 3):
-                # Don't consider the mouse wheel (button 4 & 5):
-                if self.rect.collidepoint(event.pos) and self.visible:
-                    self.set_pressed(1)
-            elif event.type == pygame.MOUSEBUTTONUP\
-                    and event.button in (1, 2, 3):
-                # Don't consider the mouse wheel (button 4 & 5):
-                self.set_pressed(0)
-            elif event.type == pygame.FINGERDOWN:
-                display_size = pygame.display.get_surface().get_size()
-                finger_pos = (event.x * display_size[0], event.y * display_size[1])
-                if self.rect.collidepoint(finger_pos) and self.visible:
-                    self.set_pressed(1)
-            elif event.type == pygame.FINGERUP:
-                self.set_pressed(0)
+        if self.image is None and self.count:
+            if self.atlas is None:
+                self.render_atlas()
+            self.image = self.renderer.create_surface(self.rect.size)
+            self.draw_all()
+            self.renderer.set_surface_alpha(self.image, 255)
+
+    def needs_update(self):
+        """Return True if the dots have to be rendered.
+        """
+        return self.image is None and self.count > 0
 
 
 class Slide(pygame.sprite.DirtySprite):
@@ -262,39 +497,77 @@ class Slide(pygame.sprite.DirtySprite):
         If set to 1, the key is selected.
     """
 
-    def __init__(self, image, renderer, load=True, parent=None):
+    def __init__(self, image, renderer, load=True, parent=None, executor=None, cache=None,
+                 disk_cache=None, native=False, pyramid=False, decode_size=None):
         """
         :param image: path to image or Pygame image displayed in the slide
         :type image: str or object
         :param renderer: render used to render the arrow
         :type renderer: :py:class:`SliderRenderer`
-        :param load: load image when initialize class
+        :param load: load image when initialize class (when the slide size is
+                     set if the image may be in the disk cache)
         :type load: bool
         :param parent: parent of the clone
         :type parent: :py:class:`Slide`
+        :param executor: executor used to decode the image in background
+        :type executor: :py:class:`concurrent.futures.Executor`
+        :param cache: cache used to store the decoded image
+        :type cache: :py:class:`SurfaceCache`
+        :param disk_cache: cache used to store the image scaled to the slide size
+        :type disk_cache: :py:class:`DiskCache`
+        :param native: keep the image in the display format if it has
+                       no transparency (on a 16 bits display, only the scaled
+                       image as smoothscale needs a 24 or 32 bits source)
+        :type native: bool
+        :param pyramid: scale the image from power-of-two downsampled levels
+                        instead of the full resolution image
+        :type pyramid: bool
+        :param decode_size: expected size of the slide, an image file is
+                            decoded downsampled to fit in twice this size
+                            (None to decode at full resolution)
+        :type decode_size: tuple
         """
         super(Slide, self).__init__()
         self.parent = parent
         if not parent:
             self._renderer = renderer
+            self._executor = executor
+            self._future = None
+            self._cache = cache
+            self._cache_key = None
+            self._disk_cache = disk_cache
+            self._disk_scaled = None
+            # Loading delayed until the slide size is known (disk cache key)
+            self._load_on_resize = False
+            # Image scaled in background: (slide size, future, scaled size)
+            self._prescaled = None
+            self._native = native
+            self._use_pyramid = pyramid
+            self._pyramid = None
+            self._decode_size = tuple(decode_size) if decode_size else None
             self._selected = 0
             self._index = 0
+            # Rendered with a fast scaling, shall be rendered again
+            self.draft = False
             self._alpha = 255
             if isinstance(image, str):
                 self._image_path = image
+                self._image_source = None
             else:
                 self._image_path = ''
                 self._image_source = image
-            if load:
-                if self._image_path:
-                    self._image_source = pygame.image.load(self._image_path).convert_alpha()
-            else:
-                raise NotImplementedError
 
         # Attributes than can differe from parents
         self.rect = pygame.Rect((0, 0), (10, 10))
         self.image = None
-        self.animations = []
+        self.placeholder = False
+        self._parent_state = None
+
+        if not parent and load:
+            if self._image_path and disk_cache is not None:
+                self._load_on_resize = True
+            else:
+                self.load()
 
     def __repr__(self):
         return f"Slide(index={self.index}, path='{self.image_path}', clone={self.parent is not None})"
@@ -333,14 +606,269 @@ class Slide(pygame.sprite.DirtySprite):
     def image_source(self):
         if self.parent:
             return self.parent.image_source
+        if not self._poll_image_source():
+            self._decode()  # Lazy loaded or evicted from the cache
+            if self._future:
+                self._future.result()  # Wait for the end of the background decoding
+                self._poll_image_source()
+        if self._cache_key:
+            return self._cache.get(self._cache_key)
         return self._image_source
 
+    @property
+    def loaded(self):
+        if self.parent:
+            return self.parent.loaded
+        if self._disk_scaled and self._disk_scaled[0] == self.rect.size:
+            return True  # Scaled image read from the disk cache
+        return self._pyramid is not None or self._poll_image_source()
+
+    @property
+    def future(self):
+        """Return the :py:class:`concurrent.futures.Future` of the background
+        decoding of the image (None if the image is not being decoded in background).
+        """
+        if self.parent:
+            return self.parent.future
+        return self._future
+
+    def _poll_image_source(self):
+        if self._future and self._future.done():
+            # Background decoding is finished, surface conversion shall be
+            # done by the main thread
+            future, self._future = self._future, None
+            surface = self._convert(future.result())
+            if self._cache_key:
+                self._cache.put(self._cache_key, surface)
+            else:
+                self._image_source = surface
+        if self._cache_key:
+            return self._cache_key in self._cache
+        return self._image_source is not None
+
+    def _get_decode_max_size(self):
+        if self._decode_size is None:
+            return None
+        return (self._decode_size[0] * 2, self._decode_size[1] * 2)
+
+    def _decode(self):
+        if self._future:
+            return  # Decoding in progress
+        max_size = self._get_decode_max_size()
+        if self._image_path and self._cache is not None:
+            self._cache_key = self._cache.get_key(self._image_path)
+            if max_size:
+                self._cache_key += (max_size,)  # Not the full resolution image
+            if self._cache.get(self._cache_key) is not None:
+                return
+        elif self._image_source is not None:
+            return
+
+        if self._executor:
+            self._future = self._executor.submit(load_image, self._image_path, max_size)
+        elif self._cache_key:
+            self._cache.put(self._cache_key, self._convert(load_image(self._image_path, max_size)))
+        else:
+            self._image_source = self._convert(load_image(self._image_path, max_size))
+
+    def _check_decode_size(self, size):
+        if not self._image_path or self._decode_size is None\
+                or (size[0] <= self._decode_size[0] and size[1] <= self._decode_size[1]):
+            return
+        # The slide is larger than expected, decode the image again to not
+        # scale up a downsampled image
+        self._decode_size = tuple(size)
+        if self._future:
+            self._future.cancel()
+            self._future = None
+        self._image_source = None
+        self._pyramid = None
+        self._cache_key = None
+
+    def _convert(self, surface):
+        if self._native and not has_alpha_channel(surface) and surface.get_colorkey() is None:
+            # No transparency, the decoded image is in the display format if
+            # it can be smoothscaled (24 or 32 bits), else only the scaled
+            # image is converted to the display format
+            display = pygame.display.get_surface()
+            if display and display.get_bitsize() in (24, 32):
+                return surface.convert()
+            return surface.convert(32)
+        return surface.convert_alpha()
+
+    def _scale(self, size, smooth=True):
+        if smooth and self.is_prescaled(size):
+            # Scaled in background, surfaces are converted by the main thread
+            prescaled, self._prescaled = self._prescaled, None
+            scaled = prescaled[1].result()
+            if isinstance(scaled, bytes):
+                scaled = pygame.image.frombuffer(scaled, prescaled[2], 'RGBA').convert_alpha()
+            if self._native and not scaled.get_flags() & pygame.SRCALPHA:
+                scaled = scaled.convert()
+            return scaled
+        scaled = self.renderer.scale_slide_image(self.get_scale_source(size), size, smooth)
+        if self._native and not scaled.get_flags() & pygame.SRCALPHA:
+            scaled = scaled.convert()
+        return scaled
+
+    def load(self):
+        """Decode the image if it is not already done. If an executor is
+        defined, the image is decoded in background.
+
+        If the image scaled to the slide size is in the disk cache, it is
+        used instead of decoding the image.
+        """
+        if self.parent:
+            return self.parent.load()
+        if self._pyramid is not None:
+            return  # Image already downsampled
+        if self._image_path and self._disk_cache is not None\
+                and self.get_scaled_image(self.rect.size, False) is not None:
+            return
+        self._decode()
+
+    def prescale(self, executor):
+        """Scale the image to the slide size in background, the scaled
+        image is used at next rendering. Nothing is done if the image is not
+        decoded or if the scaled image is in the disk cache.
+
+        With a :py:class:`concurrent.futures.ProcessPoolExecutor`, the pixels
+        are sent to the worker process and the default scaling is used.
+
+        :param executor: executor used to scale the image
+        :type executor: :py:class:`concurrent.futures.Executor`
+        """
+        if self.parent:
+            return self.parent.prescale(executor)
+        size = tuple(self.rect.size)
+        if self._prescaled and self._prescaled[0] == size:
+            return
+        self._check_decode_size(size)
+        if self._pyramid is None and not self._poll_image_source():
+            return
+        if self._image_path and self._disk_cache is not None\
+                and self.get_scaled_image(size, False) is not None:
+            return
+        image = self.get_scale_source(size)
+        scaled_size = self.renderer.get_scaled_size(image.get_size(), size)
+        if isinstance(executor, futures.ProcessPoolExecutor):
+            future = executor.submit(scale_buffer, pygame.image.tostring(image, 'RGBA'),
+                                     image.get_size(), scaled_size)
+        else:
+            future = executor.submit(self.renderer.scale_slide_image, image, size)
+        self._prescaled = (size, future, scaled_size)
+
+    def is_prescaling(self):
+        """Return True if the image is being scaled in background.
+        """
+        if self.parent:
+            return self.parent.is_prescaling()
+        return self._prescaled is not None and self._prescaled[0] == tuple(self.rect.size)\
+            and not self._prescaled[1].done()
+
+    def is_prescaled(self, size=None):
+        """Return True if the image scaled in background is ready.
+
+        :param size: size of the slide (current size if None)
+        :type size: tuple
+        """
+        if self.parent:
+            return self.parent.is_prescaled(size)
+        size = tuple(size or self.rect.size)
+        return self._prescaled is not None and self._prescaled[0] == size and self._prescaled[1].done()
+
+    def get_scale_source(self, size):
+        """Return the image to scale to fit in a slide of the given size.
+        If the pyramid is enabled, it is the smallest level larger than the
+        scaled image (the levels are built at first call).
+
+        :param size: size of the slide
+        :type size: tuple
+        """
+        if self.parent:
+            return self.parent.get_scale_source(size)
+        if not self._use_pyramid:
+            return self.image_source
+        if self._pyramid is None:
+            display = pygame.display.get_surface()
+            self._pyramid = get_pyramid(self.image_source, display.get_size() if display else None)
+            if self._image_path:
+                self._image_source = None  # Decoded again if requested
+        width, height = self.renderer.get_scaled_size(self._pyramid[0].get_size(), size)
+        for level in reversed(self._pyramid):
+            if level.get_width() >= width and level.get_height() >= height:
+                return level
+        return self._pyramid[0]
+
+    def get_scaled_image(self, size, scale=True):
+        """Return the image scaled to fit in a slide of the given size. If
+        a disk cache is defined, the scaled image is read from it when possible.
+
+        If the slide is rendered as a draft, the image is scaled with a fast
+        low quality algorithm (the result is not stored in the disk cache).
+
+        :param size: size of the slide
+        :type size: tuple
+        :param scale: if False, return None instead of scaling the image when
+                      it is not in the disk cache
+        :type scale: bool
+        """
+        if self.parent:
+            return self.parent.get_scaled_image(size, scale)
+        if not self._image_path or self._disk_cache is None:
+            return self._scale(size, not self.draft)
+
+        size = tuple(size)
+        if not self._disk_scaled or self._disk_scaled[0] != size:
+            key = self._disk_cache.get_key(self._image_path, size, self.renderer.slide_padding)
+            scaled = self._disk_cache.get(key)
+            if scaled is None:
+                if not scale:
+                    return None
+                if self.draft:
+                    return self._scale(size, False)
+                scaled = self._scale(size)
+                self._disk_cache.put(key, scaled)
+            elif self._native and not has_alpha_channel(scaled):
+                scaled = scaled.convert()
+            else:
+                scaled = scaled.convert_alpha()
+            self._disk_scaled = (size, scaled)
+        return self._disk_scaled[1]
+
+    def unload(self):
+        """Release the decoded image and the rendered surfaces. The image will
+        be decoded again when needed.
+
+        Only a slide created from an image path can be unloaded. If a cache is
+        used, the decoded image stays in the cache until it is evicted.
+        """
+        if self.parent:
+            return self.parent.unload()
+        if self._image_path and (self._image_source is not None or self._future or self._prescaled
+                                 or self._pyramid or self._cache_key or self._disk_scaled
+                                 or self.image is not None):
+            if self._future:
+                self._future.cancel()
+                self._future = None
+            if self._prescaled:
+                self._prescaled[1].cancel()
+                self._prescaled = None
+            self._image_source = None
+            self._pyramid = None
+            self._cache_key = None
+            self._disk_scaled = None
+            self.image = None
+            self.placeholder = False
+            self.draft = False
+            self.scaled = self.shape = self.shape_selected = None
+            if self.visible:
+                self.visible = 0
+
     def clone(self):
         """Return a clone of the slide. A clone has the same attributes than its parent
-        but can have different:
-         - size
-         - position
-         - animations
+        but can have different position. The clone displays the surface rendered
+        for its parent (it is not rendered again).
         """
         clone = Slide('', '', parent=self)
         clone.set_position(*self.rect.topleft)
@@ -373,6 +901,9 @@ class Slide(pygame.sprite.DirtySprite):
             self.image = None  # Force rendering
             if self.visible:
                 self.dirty = 1
+            if not self.parent and self._load_on_resize:
+                self._load_on_resize = False
+                self.load()
 
     def set_index(self, index):
         """Set index of the slide among all others.
@@ -392,7 +923,11 @@ class Slide(pygame.sprite.DirtySprite):
         """
         if self._selected != int(state):
             self._selected = int(state)
-            self.image = None  # Force rendering
+            if self.image is not None and not self.placeholder:
+                # Only compose the scaled image and the frame again
+                self.renderer.draw_slide_state(self.image, self)
+            else:
+                self.image = None  # Force rendering
             if self.visible:
                 self.dirty = 1
 
@@ -401,34 +936,84 @@ class Slide(pygame.sprite.DirtySprite):
         """
         if self._alpha != int(alpha):
             self._alpha = int(alpha)
-            self.image.set_alpha(alpha)
+            if self.image is not None:
+                self.renderer.set_surface_alpha(self.image, alpha)
             if self.visible:
                 self.dirty = 1
 
-    def add_animation(self, animation):
-        """Add a new animation. Animations are apply according to the add
-        order. When finished, animation is discarded.
-        """
-        self.animations.append(animation)
-
-    def is_animated(self):
-        """Return True if the slide is currently animated.
-        """
-        return len(self.animations) > 0
-
     def update(self, events, dt):
-        """Update slide according to current animations.
+        """Update slide image (the animations are applied and the slides
+        are rendered by the layout before this method is called).
 
         :param events: list of events to process.
         :type events: list
         :param dt: elapsed time since last call
         :type dt: int
         """
-        if self.image is None:
-            self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA, 32)
-            self.renderer.draw_slide(self.image, self)
+        if self.parent:
+            # A clone displays the surface rendered for its parent
+            state = (self.parent.selected, self.parent.alpha)
+            if self.image is not self.parent.image or self._parent_state != state:
+                self._parent_state = state
+                self.image = self.parent.image
+                if self.visible:
+                    self.dirty = 1
+
+    def needs_update(self):
+        """Return True if :py:meth:`Slide.update` has something to do: the
+        image has to be rendered or a placeholder is waiting for the image
+        decoded in background.
+        """
+        if self.parent:
+            return self.image is not self.parent.image\
+                or self._parent_state != (self.parent.selected, self.parent.alpha)\
+                or (self.visible and (self.parent.draft or self.parent.needs_render()))
+        return self.needs_render()
+
+    def needs_render(self):
+        """Return True if the slide image is not up to date: not rendered,
+        rendered as a placeholder while the image is ready or visible and
+        rendered as a draft.
+        """
+        if self.parent:
+            return self.parent.needs_render()
+        return self.placeholder or (self.draft and self.visible)\
+            or (self.image is None and (self.visible or self.loaded))
+
+    def render(self, force=False, draft=False):
+        """Render the slide image if it is not up to date. A lazy loaded
+        slide is rendered only when it is visible or when the layout has
+        requested to load it.
+
+        :param force: render the slide even if it is not visible
+        :type force: bool
+        :param draft: scale the image with a fast low quality algorithm,
+                      else a draft is rendered again
+        :type draft: bool
+        """
+        if self.parent:
+            return self.parent.render(force, draft)
+        if self.placeholder and self.loaded:
+            self.image = None  # Image decoded in background is ready
+            if self.visible:
+                self.dirty = 1
+        if self.draft and not draft:
+            self.image = None  # Render with a better quality
+            if self.visible:
+                self.dirty = 1
 
-        for animation in self.animations[:]:
-            animation(self, dt)
-            if animation.finished:
-                self.animations.remove(animation)
+        if self.image is None and (force or self.visible or self.loaded):
+            if not draft:
+                self._check_decode_size(self.rect.size)
+            # Never wait for a background decoding, a placeholder is drawn
+            self.load()
+            self.image = self.renderer.create_surface(self.rect.size)
+            if self.loaded:
+                self.placeholder = False
+                self.draft = draft
+                self.renderer.draw_slide(self.image, self)
+            else:
+                # Image is decoded in background
+                self.placeholder = True
+                self.draft = False
+                self.renderer.draw_slide_placeholder(self.image, self)
@@ -51,6 +51,9 @@ def main():
         install_requires=[
             'pygame',
         ],
+        extras_require={
+            'pillow': ['Pillow'],
+        },
         setup_requires=[
             'setuptools>=41.0.1',
             'wheel>=0.33.4'
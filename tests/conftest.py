@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import os
+import os.path as osp
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pytest
+import pygame
+
+IMAGES_DIR = osp.join(osp.dirname(osp.dirname(osp.abspath(__file__))), 'pygame_imslider', 'examples', 'images')
+
+
+class FakeClock(object):
+
+    """Clock returning a constant time step to get reproducible animations.
+    """
+
+    def __init__(self, step=50):
+        self.step = step
+
+    def tick(self, *args):
+        return self.step
+
+    def get_time(self):
+        return self.step
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    surface = pygame.display.set_mode((800, 300))
+    yield surface
+    pygame.quit()
+
+
+@pytest.fixture
+def images():
+    return sorted(osp.join(IMAGES_DIR, name) for name in os.listdir(IMAGES_DIR) if name.endswith('.png'))
+
+
+def key_events(key):
+    return [[pygame.event.Event(pygame.KEYDOWN, key=key)], [pygame.event.Event(pygame.KEYUP, key=key)]]
+
+
+def run_frames(slider, screen, count=1, events=()):
+    """Update and draw the slider ``count`` times, the events are given at
+    the first frame only.
+    """
+    for _ in range(count):
+        slider.update(list(events))
+        slider.draw(screen)
+        events = ()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import pygame_imslider.animations as anim
+
+
+class Recorder(anim.Animation):
+
+    """Animation recording its calls, finished after ``duration`` seconds.
+    """
+
+    calls = []
+
+    def _apply(self, sprite):
+        self.calls.append((sprite, self))
+        if self.time >= self.duration:
+            self.finished = True
+
+
+def test_scheduler():
+    scheduler = anim.Scheduler()
+    first, second = object(), object()
+    animations = [Recorder(None, 0.1), Recorder(None, 0.2), Recorder(None, 0.1)]
+    scheduler.add(first, animations[0])
+    scheduler.add(second, animations[2])
+    scheduler.add(first, animations[1])
+    assert len(scheduler) == 3
+    assert scheduler.is_running(first) and scheduler.is_running(second)
+
+    del Recorder.calls[:]
+    scheduler.update(0.1)
+    # Animations of a sprite applied according to the add order
+    assert Recorder.calls == [(first, animations[0]), (first, animations[1]), (second, animations[2])]
+    assert len(scheduler) == 1
+    assert scheduler.is_running(first) and not scheduler.is_running(second)
+
+    scheduler.remove(first)
+    assert not scheduler.is_running()
+    scheduler.remove(second)  # Not animated
+
+
+class Strip(object):
+
+    def __init__(self):
+        self.offset = 0
+        self.offsets = []
+
+    def set_offset(self, offset):
+        self.offset = offset
+        self.offsets.append(offset)
+
+
+def test_scroll():
+    scheduler = anim.Scheduler()
+    strip = Strip()
+    scheduler.add(strip, anim.Scroll(None, -250, 0.3))
+    while scheduler.is_running():
+        scheduler.update(0.07)
+    assert strip.offsets == [-59, -117, -176, -234, -250]  # Destination not overrun
+
+    scheduler.add(strip, anim.Scroll(None, 40, 0))
+    scheduler.update(0.01)
+    assert strip.offset == 40 and not scheduler.is_running()
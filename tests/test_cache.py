@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+import os
+import errno
+import os.path as osp
+import pygame
+import pygame_imslider as imslider
+from pygame_imslider import sprites
+from pygame_imslider.slider import HERE
+from conftest import FakeClock, run_frames
+
+
+def test_surface_cache_eviction():
+    surface = pygame.Surface((10, 10), pygame.SRCALPHA, 32)
+    size = imslider.SurfaceCache.get_surface_size(surface)
+    cache = imslider.SurfaceCache(max_size=2 * size)
+    cache.put('a', surface)
+    cache.put('b', surface)
+    assert cache.get('a') is surface  # 'b' is the least recently used
+    cache.put('c', surface)
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+    assert cache.size == 2 * size
+    assert cache.get('b') is None
+    assert cache.get_stats()['evictions'] == 1
+    assert cache.get_stats()['hits'] == 1 and cache.get_stats()['misses'] == 1
+
+    cache.put('big', pygame.Surface((100, 100), pygame.SRCALPHA, 32))
+    assert list(cache._surfaces) == ['big']  # Last added never evicted
+    cache.clear()
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_surface_cache_shared(screen, images, monkeypatch):
+    decoded = []
+    load_image = sprites.load_image
+    monkeypatch.setattr(sprites, 'load_image', lambda *args: decoded.append(args) or load_image(*args))
+    cache = imslider.SurfaceCache()
+    for _ in range(2):
+        slider = imslider.ImSlider(screen.get_size(), cache=cache)
+        slider.clock = FakeClock()
+        slider.load_images(images[:3])
+        run_frames(slider, screen, 2)
+    assert len(decoded) == 3  # Second slider uses the decoded images
+
+
+def test_disk_cache_corrupted_file(tmp_path):
+    cache = imslider.DiskCache(str(tmp_path))
+    surface = pygame.Surface((20, 10), pygame.SRCALPHA, 32)
+    surface.fill((10, 20, 30, 40))
+    cache.put('key', surface)
+    assert cache.get('key').get_at((5, 5)) == (10, 20, 30, 40)
+
+    path = cache.get_path('key')
+    with open(path, 'r+b') as fp:
+        fp.truncate(os.path.getsize(path) - 1)
+    assert cache.get('key') is None
+    with open(path, 'wb') as fp:
+        fp.write(b'\x01')
+    assert cache.get('key') is None
+    with open(path, 'wb') as fp:
+        fp.write(cache.HEADER.pack(100000, 100000, 4))
+    assert cache.get('key') is None
+    assert cache.get_stats()['hits'] == 1
+    assert cache.get_stats()['misses'] == 3
+
+
+def test_disk_cache_not_lazy(screen, images, tmp_path, monkeypatch):
+    decoded = []
+    load_image = sprites.load_image
+    monkeypatch.setattr(sprites, 'load_image', lambda *args: decoded.append(args) or load_image(*args))
+
+    counts = []
+    for _ in range(2):
+        del decoded[:]
+        slider = imslider.ImSlider(screen.get_size(), disk_cache=imslider.DiskCache(str(tmp_path)))
+        slider.clock = FakeClock()
+        slider.load_images(images[:3])
+        run_frames(slider, screen, 10)
+        assert slider.get_image(True) is not None
+        counts.append(len(decoded))
+    assert counts == [3, 0]  # Scaled images read from the disk cache at second start
+
+
+def test_disk_cache_write_error(screen, images, tmp_path, monkeypatch):
+    def replace(src, dst):
+        raise OSError(errno.ENOSPC, 'No space left on device')
+    monkeypatch.setattr(os, 'replace', replace)
+
+    cache = imslider.DiskCache(str(tmp_path))
+    slider = imslider.ImSlider(screen.get_size(), disk_cache=cache)
+    slider.clock = FakeClock()
+    slider.load_images(images[:3])
+    run_frames(slider, screen, 5)
+    assert slider.get_image(True) is not None  # Scaled image kept anyway
+    assert cache.get_stats()['errors'] > 0
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_disk_cache_max_size(tmp_path):
+    surface = pygame.Surface((10, 10), pygame.SRCALPHA, 32)
+    file_size = imslider.DiskCache.HEADER.size + 10 * 10 * 4
+    cache = imslider.DiskCache(str(tmp_path), max_size=3 * file_size)
+    for index in range(3):
+        assert cache.put(index, surface)
+        os.utime(cache.get_path(index), (index, index))
+    assert cache.get(0) is not None  # Most recently used
+    cache.put(3, surface)
+    assert sorted(os.listdir(str(tmp_path))) == sorted(osp.basename(cache.get_path(key)) for key in (0, 2, 3))
+    assert cache.size == 3 * file_size
+
+    # Size of the existing files counted at creation
+    assert imslider.DiskCache(str(tmp_path), max_size=2 * file_size).size == 2 * file_size
+
+
+def test_disk_cache_native_depth(screen, images, tmp_path):
+    opaque = pygame.Surface((10, 10))
+    opaque.fill((1, 2, 3))
+    cache = imslider.DiskCache(str(tmp_path))
+    cache.put('opaque', opaque)
+    assert os.path.getsize(cache.get_path('opaque')) == cache.HEADER.size + 10 * 10 * 3
+    assert cache.get('opaque').get_at((0, 0)) == (1, 2, 3, 255)
+
+    for _ in range(2):  # Second time, scaled images are read from the disk cache
+        slider = imslider.ImSlider(screen.get_size(), disk_cache=imslider.DiskCache(str(tmp_path)),
+                                   native_depth=True)
+        slider.clock = FakeClock()
+        slider.load_images(images[:3])
+        run_frames(slider, screen, 5)
+        image = slider.get_image(True)
+        assert image.get_masks() == screen.get_masks()
+
+
+def test_asset_registry(screen):
+    assets = imslider.AssetRegistry(max_count=2)
+    path = osp.join(HERE, 'dot.png')
+    source = assets.load(path)
+    assert assets.load(osp.relpath(path)) is source  # Decoded once
+
+    built = []
+
+    def build(key):
+        def func():
+            built.append(key)
+            return pygame.Surface((1, 1))
+        return func
+    surfaces = [assets.get(key, build(key)) for key in ('a', 'b', 'a', 'c')]
+    assert built == ['a', 'b', 'c'] and surfaces[0] is surfaces[2]
+    assert len(assets) == 2
+    assets.get('c', build('c'))
+    assets.get('b', build('b'))  # Least recently used discarded
+    assert built == ['a', 'b', 'c', 'b']
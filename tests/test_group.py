@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import pygame
+import pygame_imslider as imslider
+from conftest import FakeClock
+
+
+def test_key_released_after_focus_change(screen, images):
+    first = imslider.ImSlider((400, 300))
+    second = imslider.ImSlider((400, 300))
+    second.set_position(400, 0)
+    group = imslider.SliderGroup(first, second)
+    group.clock = FakeClock()
+    for slider in group:
+        slider.load_images(images[:9])
+
+    group.update([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)])
+    pos = second.get_rect().center
+    group.update([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)])
+    group.update([pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1)])
+    assert group.focus is second
+    group.update([pygame.event.Event(pygame.KEYUP, key=pygame.K_RIGHT)])
+    for _ in range(200):
+        group.update([])
+    assert not first.arrows[1].pressed
+    assert first.get_index() == 1
+
+
+def test_mouse_wheel_keeps_focus(screen, images):
+    first = imslider.ImSlider((400, 300))
+    second = imslider.ImSlider((400, 300))
+    second.set_position(400, 0)
+    group = imslider.SliderGroup(first, second)
+    group.clock = FakeClock()
+    pos = second.get_rect().center
+    for button in (4, 5):
+        group.update([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button),
+                      pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=button)])
+    assert group.focus is first
+    group.update([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)])
+    assert group.focus is second
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import pygame
+import pygame_imslider as imslider
+from conftest import FakeClock, run_frames
+
+
+@pytest.mark.parametrize('stype, count, index', [(imslider.STYPE_SLIDE, 300, 299),
+                                                 (imslider.STYPE_LOOP, 40, 20)])
+def test_group_narrowed_after_long_jump(screen, images, stype, count, index):
+    slider = imslider.ImSlider(screen.get_size(), stype=stype)
+    slider.clock = FakeClock()
+    slider.load_images((images * count)[:count], lazy=True)
+    run_frames(slider, screen)
+    slider.set_index(index)
+    assert len(slider.layout) > 10
+    run_frames(slider, screen, 50)
+    assert not slider.layout.is_animated()
+    assert len(slider.layout) <= 5
+    assert not slider.needs_update()
+
+
+@pytest.mark.parametrize('stype', [imslider.STYPE_SLIDE, imslider.STYPE_LOOP])
+def test_slides_unloaded_after_long_jump(screen, images, stype):
+    slider = imslider.ImSlider(screen.get_size(), stype=stype, preload=2)
+    slider.clock = FakeClock()
+    slider.load_images((images * 4)[:40], lazy=True)
+    run_frames(slider, screen)
+    slider.set_index(20)
+    run_frames(slider, screen, 50)
+    loaded = [slide.index for slide in slider.layout.slides if slide.loaded]
+    assert loaded == list(range(18, 23))
+
+
+def test_fade_navigation_during_transition(screen, images):
+    slider = imslider.ImSlider(screen.get_size(), stype=imslider.STYPE_FADE, rewind=True)
+    slider.clock = FakeClock()
+    slider.load_images(images[:9])
+    run_frames(slider, screen, 2)
+    for index in (1, 2, 5, 4):
+        slider.set_index(index)
+        run_frames(slider, screen)
+        assert len(slider.layout.scheduler) == 1  # A single blend is running
+    run_frames(slider, screen, 20)
+    assert not slider.layout.is_animated()
+    expected = screen.copy()
+
+    reference = imslider.ImSlider(screen.get_size(), stype=imslider.STYPE_FADE)
+    reference.clock = FakeClock()
+    reference.load_images(images[:9])
+    reference.set_index(slider.get_index())
+    screen.fill((0, 0, 0))
+    run_frames(reference, screen, 20)
+    clip = slider.layout.get_clip()
+    assert pygame.image.tostring(screen.subsurface(clip), 'RGB')\
+        == pygame.image.tostring(expected.subsurface(clip), 'RGB')
+
+
+@pytest.mark.parametrize('stype', [imslider.STYPE_SLIDE, imslider.STYPE_LOOP])
+def test_slide_at_position(screen, images, stype):
+    slider = imslider.ImSlider(screen.get_size(), stype=stype, per_page=3)
+    slider.clock = FakeClock()
+    slider.load_images(images[:6])
+    run_frames(slider, screen)
+    layout = slider.layout
+    slider.set_index(4)  # Check positions during the move too
+    run_frames(slider, screen)
+    assert layout.is_animated()
+    for _ in range(3):
+        clip = layout.get_clip()
+        for x in range(0, screen.get_width(), 7):
+            for y in range(0, screen.get_height(), 11):
+                expected = [slide for slide in layout.get_visible_slides()
+                            if slide.rect.collidepoint(x, y) and clip.collidepoint(x, y)]
+                assert layout.get_slide_at((x, y)) == (expected[0] if expected else None)
+        run_frames(slider, screen, 3)
+
+
+def test_loop_ring(screen, images):
+    slider = imslider.ImSlider(screen.get_size(), stype=imslider.STYPE_LOOP, per_page=3)
+    slider.clock = FakeClock()
+    slider.load_images(images[:2])
+    run_frames(slider, screen)
+    layout = slider.layout
+    step = layout.get_step()
+    for _ in range(9):
+        slider.on_next()
+        run_frames(slider, screen, 20)
+        assert not layout.is_animated()
+        visibles = layout.get_visible_slides()
+        # A clone is displayed when a slide is at several positions
+        assert len(set(visibles)) == len(visibles) == 3
+        assert [slide.index for slide in visibles] == [(slider.get_index() + i) % 2 for i in range(3)]
+        assert all(slide.image is slide.parent.image for slide in visibles if slide.parent)
+        # Strip positions are kept close to the slides indexes
+        assert abs(layout.offset) <= 3 * step
+
+
+@pytest.mark.parametrize('stype', [imslider.STYPE_SLIDE, imslider.STYPE_LOOP])
+def test_composed_strip(screen, images, stype):
+    sliders = []
+    for compose_strip in (False, True):
+        slider = imslider.ImSlider(screen.get_size(), stype=stype, per_page=2, compose_strip=compose_strip)
+        slider.clock = FakeClock()
+        slider.load_images(images)
+        sliders.append(slider)
+
+    dirty = []
+    draw = sliders[1].layout.draw
+
+    def record(surface):
+        dirty[:] = draw(surface)
+        return dirty[:]
+    sliders[1].layout.draw = record
+
+    moves = 0
+    for index in (3, 1):
+        frames = []
+        for slider in sliders:
+            screen.fill((0, 0, 0))
+            slider.update([])
+            slider.draw(screen, force=True)
+            slider.set_index(index)
+            frames.append([])
+            for _ in range(15):
+                slider.update([])
+                animated = slider.layout.is_animated()
+                slider.draw(screen)
+                if slider is sliders[1] and animated:
+                    assert len(dirty) == 1  # A single blit of the strip
+                    moves += 1
+                frames[-1].append(pygame.image.tostring(screen, 'RGB'))
+        assert frames[0] == frames[1]
+    assert moves > 5
+
+
+@pytest.mark.parametrize('stype', [imslider.STYPE_SLIDE, imslider.STYPE_LOOP, imslider.STYPE_FADE])
+def test_fast_motion(screen, images, stype):
+    sliders = []
+    for fast_motion in (True, False):
+        slider = imslider.ImSlider(screen.get_size(), stype=stype, fast_motion=fast_motion)
+        slider.clock = FakeClock()
+        slider.load_images(images * 2, lazy=True)
+        screen.fill((0, 0, 0))
+        run_frames(slider, screen, 2)
+        slider.set_index(4)
+        drafts = []
+        for _ in range(30):
+            run_frames(slider, screen)
+            drafts.append(any(slide.draft for slide in slider.layout.get_visible_slides()))
+        assert not slider.layout.is_animated()
+        sliders.append((drafts, screen.copy()))
+
+    assert any(sliders[0][0]) and not sliders[0][0][-1]  # Smooth scaling at the end of the move
+    assert not any(sliders[1][0])
+    assert pygame.image.tostring(sliders[0][1], 'RGB') == pygame.image.tostring(sliders[1][1], 'RGB')
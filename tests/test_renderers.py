@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+import pygame
+import pygame_imslider as imslider
+from pygame_imslider.renderers import has_alpha_channel, get_pyramid
+from conftest import FakeClock, key_events, run_frames
+
+
+def test_has_alpha_channel_after_set_alpha(screen):
+    surface = pygame.Surface((10, 10))
+    surface.set_alpha(0)
+    assert not has_alpha_channel(surface)
+    assert has_alpha_channel(pygame.Surface((10, 10), pygame.SRCALPHA, 32))
+
+
+def test_fade_keeps_slide_corners(screen, images):
+    slider = imslider.ImSlider(screen.get_size(), stype=imslider.STYPE_FADE, speed=0, rewind=True)
+    slider.clock = FakeClock()
+    slider.load_images(images[:9])
+    run_frames(slider, screen)
+    for key in (pygame.K_LEFT, pygame.K_LEFT, pygame.K_RIGHT):
+        for events in key_events(key):
+            run_frames(slider, screen, 5, events)
+    assert slider.get_index() == 8
+    assert screen.get_at((105, 25))[:3] != (0, 0, 0)
+
+
+def test_transparent_slides(screen, images):
+    default = imslider.ImSliderRenderer.DEFAULT
+    renderer = imslider.ImSliderRenderer(default.arrow_color, default.dot_color, None,
+                                         default.selection_color, default.selection_page_color,
+                                         (0, 0, 0, 0))
+    slider = imslider.ImSlider(screen.get_size(), renderer=renderer, per_page=3)
+    slider.clock = FakeClock()
+    slider.load_images(images[:5])
+    run_frames(slider, screen, 2)
+    slides = [slide for slide in slider.layout.slides if slide.image is not None]
+    assert len(slides) > 1
+    assert slides[0].shape is slides[1].shape  # Memoized
+    # Slides images are composed again when selected, they are not RLE encoded
+    assert all(has_alpha_channel(slide.image) for slide in slides)
+    assert not any(slide.image.get_flags() & pygame.RLEACCEL for slide in slides)
+    assert slider.background.image.get_flags() & pygame.RLEACCEL
+
+
+def test_selection_recomposed(screen, images, monkeypatch):
+    slider = imslider.ImSlider(screen.get_size(), per_page=3)
+    slider.clock = FakeClock()
+    slider.load_images(images[:5])
+    run_frames(slider, screen, 2)
+    slide = slider.layout.slides[1]
+    position = (3, slide.rect.height // 2)
+    assert slide.image.get_at(position)[:3] == slider.renderer.slide_color
+
+    scaled = []
+    scale_slide_image = slider.renderer.scale_slide_image
+    monkeypatch.setattr(slider.renderer, 'scale_slide_image', lambda *args: scaled.append(args) or scale_slide_image(*args))
+    slider.set_index(1)
+    run_frames(slider, screen, 20)
+    assert slide.image.get_at(position)[:3] == slider.renderer.selection_color
+    assert scaled == []  # Image not scaled again
+
+
+def make_renderer(assets=None):
+    return imslider.ImSliderRenderer((255, 255, 255), (200, 200, 200), (10, 20, 30),
+                                     (0, 255, 0), (0, 0, 255), (0, 0, 0), assets=assets)
+
+
+def test_memoized_frames(screen):
+    renderer = make_renderer()
+    frame = renderer.get_frame((50, 40), (10, 20, 30))
+    assert renderer.get_frame((50, 40), (10, 20, 30)) is frame
+    assert renderer.get_frame((50, 41), (10, 20, 30)) is not frame
+
+    renderer.memo_size = 2
+    renderer.get_frame((10, 10), (1, 1, 1))
+    renderer.get_frame((20, 20), (1, 1, 1))
+    assert len(renderer._memo) == 2
+    assert renderer.get_frame((50, 40), (10, 20, 30)) is not frame  # Discarded
+
+
+
+def test_icons_shared_by_renderers(screen):
+    assets = imslider.AssetRegistry()
+    image = pygame.Surface((40, 40), pygame.SRCALPHA)
+    image.fill((255, 255, 255, 255))
+    renderer1 = make_renderer(assets)
+    renderer2 = make_renderer(assets)
+
+    icon = renderer1.get_icon(image, (20, 20), (255, 0, 0))
+    assert icon.get_size() == (20, 20)
+    assert icon.get_at((10, 10))[:3] == (255, 0, 0)
+    assert renderer2.get_icon(image, (20, 20), (255, 0, 0)) is icon
+    assert renderer2.get_icon(image, (20, 20), (0, 0, 255)) is not icon
+    assert make_renderer().get_icon(image, (20, 20), (255, 0, 0)) is not icon
+
+
+def test_pyramid_levels(screen):
+    image = pygame.Surface((1000, 600))
+    assert [level.get_size() for level in get_pyramid(image)] == [(1000, 600), (500, 300), (250, 150), (125, 75), (62, 37)]
+    levels = get_pyramid(image, (300, 200))
+    assert [level.get_size() for level in levels] == [(500, 300), (250, 150), (125, 75), (62, 37)]
+    assert image not in levels
+    assert get_pyramid(image, (300, 200), min_size=100)[-1].get_size() == (250, 150)
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from concurrent import futures
+import pytest
+import pygame
+import pygame_imslider as imslider
+from pygame_imslider import sprites
+from conftest import FakeClock, key_events, run_frames
+
+
+def wait_decoded(slider, screen, timeout=5):
+    start = time.time()
+    while any(slide.future and not slide.future.done() for slide in slider.layout.slides)\
+            and time.time() - start < timeout:
+        time.sleep(0.01)
+    run_frames(slider, screen, 2)
+
+
+def test_threaded_never_waits_decoding(screen, images, monkeypatch):
+    decoding = threading.Event()
+    decoding.set()
+    load_image = sprites.load_image
+
+    def slow_load_image(*args):
+        decoding.wait(2)
+        return load_image(*args)
+    monkeypatch.setattr(sprites, 'load_image', slow_load_image)
+
+    slider = imslider.ImSlider(screen.get_size())
+    slider.clock = FakeClock()
+    slider.load_images(images[:3], threaded=True)
+    wait_decoded(slider, screen)
+    slide = slider.layout.slides[0]
+    assert not slide.placeholder
+
+    # Slide larger than the size the image was decoded for
+    decoding.clear()
+    slider.set_size(1000, 400)
+    start = time.time()
+    run_frames(slider, screen, 10)
+    assert time.time() - start < 1
+    assert slide.placeholder
+
+    decoding.set()
+    wait_decoded(slider, screen)
+    assert not slide.placeholder
+    assert slide.image.get_size() == slide.rect.size
+    slider.close()
+
+
+def test_close_stops_threads(screen, images):
+    slider = imslider.ImSlider(screen.get_size())
+    slider.clock = FakeClock()
+    for _ in range(3):
+        slider.load_images(images[:3], threaded=True)
+    executor = slider.executor
+    slider.close()
+    assert slider.executor is None
+    assert executor._shutdown
+    run_frames(slider, screen, 2)
+
+    slider.load_images(images[:3], threaded=True)
+    wait_decoded(slider, screen)
+    assert slider.get_image(True) is not None
+    slider.close()
+
+
+def test_arrow_pressed_key(screen, images):
+    slider = imslider.ImSlider(screen.get_size())
+    slider.clock = FakeClock()
+    slider.load_images(images[:5])
+    slider.arrows[0].pressed_key = pygame.K_a
+    slider.arrows[1].pressed_key = pygame.K_d
+    run_frames(slider, screen)
+
+    for events in key_events(pygame.K_RIGHT):
+        run_frames(slider, screen, 1, events)
+    assert slider.get_index() == 0
+    for events in key_events(pygame.K_d):
+        run_frames(slider, screen, 1, events)
+        assert slider.arrows[1].pressed == (events[0].type == pygame.KEYDOWN)
+    assert slider.get_index() == 1
+    run_frames(slider, screen, 20)
+    for events in key_events(pygame.K_a):
+        run_frames(slider, screen, 1, events)
+    assert slider.get_index() == 0
+
+
+def test_lazy_loading(screen, images):
+    slider = imslider.ImSlider(screen.get_size(), preload=2)
+    slider.clock = FakeClock()
+    slider.load_images((images * 3)[:20], lazy=True)
+    assert [slide.index for slide in slider.layout.slides if slide.loaded] == [0, 1, 2]
+    run_frames(slider, screen, 3)
+    assert [slide.index for slide in slider.layout.slides if slide.image is not None] == [0, 1, 2]
+
+    slider.set_index(1)
+    run_frames(slider, screen, 20)
+    assert [slide.index for slide in slider.layout.slides if slide.loaded] == [0, 1, 2, 3]
+    slider.set_index(10)
+    run_frames(slider, screen, 20)
+    assert [slide.index for slide in slider.layout.slides if slide.loaded] == [8, 9, 10, 11, 12]
+
+
+def test_get_future(screen, images):
+    slider = imslider.ImSlider(screen.get_size())
+    slider.clock = FakeClock()
+    slider.load_images(images[:3], threaded=True)
+    future = slider.get_future(2)
+    assert future is not None
+    future.result()
+    wait_decoded(slider, screen)
+    assert slider.layout.slides[2].loaded  # Result collected by the main thread
+    assert slider.get_future(2) is None
+    slider.close()
+
+
+def test_idle(screen, images):
+    slider = imslider.ImSlider(screen.get_size())
+    slider.clock = FakeClock()
+    slider.load_images(images)
+    assert slider.needs_update()
+    run_frames(slider, screen, 3)
+    assert not slider.needs_update() and not slider.needs_redraw()
+    slider.update([])
+    assert slider.draw(screen) == []
+
+    motion = pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0), rel=(0, 0), buttons=(0, 0, 0))
+    wheel = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(0, 0), button=4)
+    assert not slider.needs_update([motion, wheel])
+    assert slider.needs_update(key_events(pygame.K_RIGHT)[0])
+
+    # Idle time is not counted in the animation
+    offset = slider.layout.offset
+    slider.set_index(1)
+    slider.update([], dt=10)
+    assert slider.layout.is_animated() and slider.layout.offset != offset
+    assert slider.draw(screen) != []
+
+
+def test_resize_draft(screen, images):
+    slider = imslider.ImSlider((600, 200), per_page=2)
+    slider.clock = FakeClock()
+    slider.load_images(images)
+    run_frames(slider, screen, 3)
+    slider.set_size(700, 250)
+    run_frames(slider, screen)
+    visibles = slider.layout.get_visible_slides()
+    assert slider.layout.is_resizing()
+    assert all(slide.draft for slide in visibles)
+    hidden = [slide for slide in slider.layout if not slide.visible]
+    assert hidden and all(slide.needs_render() for slide in hidden)  # Not rendered while resizing
+
+    run_frames(slider, screen, 5)
+    assert not slider.layout.is_resizing()
+    assert not any(slide.draft for slide in visibles)
+    expected = screen.copy()
+
+    reference = imslider.ImSlider((700, 250), per_page=2)
+    reference.clock = FakeClock()
+    reference.load_images(images)
+    screen.fill((0, 0, 0))
+    run_frames(reference, screen, 3)
+    assert pygame.image.tostring(screen, 'RGB') == pygame.image.tostring(expected, 'RGB')
+
+
+@pytest.mark.parametrize('executor_class', [futures.ThreadPoolExecutor, futures.ProcessPoolExecutor])
+def test_render_executor(screen, images, executor_class):
+    reference = imslider.ImSlider(screen.get_size(), per_page=2)
+    reference.clock = FakeClock()
+    reference.load_images(images)
+    run_frames(reference, screen, 3)
+    expected = screen.copy()
+
+    submitted = []
+
+    class Executor(executor_class):
+
+        def submit(self, *args):
+            future = super(Executor, self).submit(*args)
+            submitted.append(future)
+            return future
+
+    with Executor(max_workers=2) as executor:
+        slider = imslider.ImSlider(screen.get_size(), per_page=2, render_executor=executor)
+        slider.clock = FakeClock()
+        slider.load_images(images)
+        screen.fill((0, 0, 0))
+        run_frames(slider, screen)
+        assert len(submitted) == len(slider.layout)  # All scaled in parallel
+        futures.wait(submitted, timeout=10)
+        assert all(future.exception() is None for future in submitted)
+        run_frames(slider, screen, 2)
+        assert not any(slide.needs_render() for slide in slider.layout)
+    assert pygame.image.tostring(screen, 'RGB') == pygame.image.tostring(expected, 'RGB')
+
+
+@pytest.mark.parametrize('threaded', [False, True])
+def test_decoded_again_on_growth(screen, tmp_path, threaded):
+    image = pygame.Surface((1600, 1200), 0, 24)
+    path = str(tmp_path / 'large.png')
+    pygame.image.save(image, path)
+
+    slider = imslider.ImSlider((300, 150))
+    slider.clock = FakeClock()
+    slider.load_images([path], threaded=threaded)
+    wait_decoded(slider, screen)
+    slide = slider.layout.slides[0]
+    size = slide.image_source.get_size()
+    assert size[0] <= 2 * slide.rect.width and size[1] <= 2 * slide.rect.height
+
+    slider.set_size(800, 300)
+    run_frames(slider, screen, 5)  # End of the resize
+    wait_decoded(slider, screen)
+    width, height = slide.image_source.get_size()
+    assert width > size[0] and height > size[1]
+    assert (width, height) == sprites.fit_size((1600, 1200), (2 * slide.rect.width, 2 * slide.rect.height))
+    assert not slide.draft and not slide.placeholder
+
+    slider = imslider.ImSlider((300, 150), full_resolution=True)
+    slider.load_images([path], threaded=threaded)
+    assert slider.layout.slides[0].image_source.get_size() == (1600, 1200)
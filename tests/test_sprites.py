@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import os.path as osp
+import pytest
+import pygame
+import pygame_imslider as imslider
+from pygame_imslider import sprites
+from pygame_imslider.slider import HERE
+
+
+@pytest.fixture(params=[True, False], ids=['pillow', 'pygame'])
+def decoder(request, monkeypatch):
+    if request.param:
+        pytest.importorskip('PIL')
+    else:
+        monkeypatch.setattr(sprites, 'Image', None)
+
+
+@pytest.mark.parametrize('colorkey', [None, 0])
+def test_load_palette_image_reduced(screen, tmp_path, decoder, colorkey):
+    image = pygame.Surface((2000, 1000), 0, 8)
+    image.set_palette([(index, 255 - index, 128) for index in range(256)])
+    image.fill(200)
+    image.fill(0, (0, 0, 100, 100))
+    path = str(tmp_path / 'palette.png')
+    if colorkey is None:
+        pygame.image.save(image, path)
+    else:
+        # The color key is not saved by pygame
+        Image = pytest.importorskip('PIL.Image')
+        palette = Image.frombytes('P', image.get_size(), pygame.image.tostring(image, 'P'))
+        palette.putpalette([value for color in image.get_palette() for value in color[:3]])
+        palette.save(path, transparency=colorkey)
+
+    surface = sprites.load_image(path, (400, 300))
+    assert surface.get_size() == (400, 200)
+    assert all(abs(a - b) <= 3 for a, b in zip(surface.get_at((100, 150)), (200, 55, 128)))
+    if colorkey is not None:
+        assert surface.get_at((5, 5))[3] == 0
+    assert sprites.load_image(path).get_size() == (2000, 1000)
+
+
+def test_native_decoded_image(screen, tmp_path, monkeypatch):
+    path = str(tmp_path / 'opaque.png')
+    pygame.image.save(pygame.Surface((40, 20), 0, 24), path)
+    renderer = imslider.ImSliderRenderer.DEFAULT
+    assert sprites.Slide(path, renderer).image_source.get_masks()[3] != 0
+    image = sprites.Slide(path, renderer, native=True).image_source
+    assert image.get_masks() == screen.get_masks()
+    assert image.get_bitsize() == screen.get_bitsize()
+
+    # Smoothscale needs a 24 or 32 bits source
+    monkeypatch.setattr(pygame.display, 'get_surface', lambda: pygame.Surface((10, 10), 0, 16))
+    image = sprites.Slide(path, renderer, native=True).image_source
+    assert image.get_bitsize() == 32 and image.get_masks()[3] == 0
+
+
+def test_pagination_window(screen):
+    pagination = sprites.Pagination(osp.join(HERE, 'dot.png'), imslider.ImSliderRenderer.DARK)
+    pagination.set_size(100, 10)  # 7 dots of 10 pixels, spaced by 5 pixels
+    pagination.set_count(20)
+    pagination.set_position(50, 20)
+    pagination.update([], 0)
+    assert pagination.rect == (50, 20, 100, 10)
+    assert [pagination.get_page_at((x, 25)) for x in (50, 59, 60, 65, 149, 150)] == [0, 0, None, 1, 6, None]
+    assert pagination.get_page_at((55, 30)) is None
+
+    def cell(page):
+        area = pygame.Rect((page - pagination.first) * pagination.pitch, 0, 10, 10)
+        return pygame.image.tostring(pagination.image.subsurface(area), 'RGBA')
+
+    def atlas(state):
+        return pygame.image.tostring(pagination.atlas.subsurface((state * 10, 0, 10, 10)), 'RGBA')
+
+    assert cell(0) == atlas(pagination.SELECTED) and cell(1) == atlas(pagination.RELEASED)
+    pagination.set_selected(5)  # Window not moved, only two dots redrawn
+    assert pagination.first == 0
+    assert cell(0) == atlas(pagination.RELEASED) and cell(5) == atlas(pagination.SELECTED)
+    pagination.set_selected(6)  # Window centered on the last displayed page
+    assert pagination.first == 3 and pagination.get_page_at((50, 25)) == 3
+    assert cell(6) == atlas(pagination.SELECTED)
+    pagination.set_selected(19)
+    assert pagination.first == 13 and pagination.get_page_at((149, 25)) == 19
+
+
+def large_image(tmp_path):
+    image = pygame.Surface((1600, 1200), 0, 24)
+    image.fill((200, 100, 50))
+    path = str(tmp_path / 'large.png')
+    pygame.image.save(image, path)
+    return path
+
+
+def test_pyramid_decoded_again_on_growth(screen, tmp_path):
+    renderer = imslider.ImSliderRenderer.DEFAULT
+    slide = sprites.Slide(large_image(tmp_path), renderer, pyramid=True, decode_size=(100, 75))
+    slide.set_size(100, 75)
+    slide.render(True)
+    assert [level.get_size() for level in slide._pyramid] == [(200, 150), (100, 75), (50, 37)]
+    assert slide._image_source is None  # Only the levels are kept
+
+    slide.set_size(400, 300)
+    slide.render(True)
+    # Levels built from an image decoded again at the new size (the display is 800x300)
+    assert [level.get_size() for level in slide._pyramid] == [(400, 300), (200, 150), (100, 75), (50, 37)]
+    scaled_size = renderer.get_scaled_size((1600, 1200), (400, 300))
+    assert slide.get_scale_source((400, 300)).get_width() >= scaled_size[0]  # Not scaled up